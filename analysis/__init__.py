@@ -1,2 +1,2 @@
-from .sentiment import SentimentAnalyzer
-from .scorer import ProductScorer
+from .sentiment import SentimentAnalyzer, aggregate_sentiment
+from .scorer import ProductScorer, log_volume
@@ -6,9 +6,30 @@ Calculates a score based on multiple factors to identify promising products.
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import math
+import re
+
+import numpy as np
 
 from config.settings import SCORING_WEIGHTS, POSITIVE_KEYWORDS, NEGATIVE_KEYWORDS
 
+# log10(n + 1) for the small post/review counts seen in volume bonuses
+_LOG10_TABLE = [math.log10(i + 1) for i in range(101)]
+
+# Purchase-intent and warning phrases, each matched anywhere in a mention
+# with one alternation search instead of one substring scan per phrase
+_INTENT_RE = re.compile('|'.join(map(re.escape, [
+    "buy", "purchase", "recommend", "worth", "should i",
+    "looking for", "need", "want", "best", "alternative"
+])))
+_WARNING_RE = re.compile('|'.join(map(re.escape, ["don't buy", "avoid", "scam", "waste"])))
+
+
+def log_volume(count: int) -> float:
+    """Return log10(count + 1), using a lookup table for counts up to 100."""
+    if isinstance(count, int) and 0 <= count <= 100:
+        return _LOG10_TABLE[count]
+    return math.log10(count + 1)
+
 
 class ProductScorer:
     """
@@ -102,7 +123,7 @@ class ProductScorer:
             return 0.0
 
         now = datetime.utcnow()
-        recency_scores = []
+        days_old = []
 
         for mention in mentions:
             created_at = mention.get("created_at")
@@ -113,15 +134,13 @@ class ProductScorer:
                     except ValueError:
                         continue
 
-                days_old = (now - created_at).days
-                # Decay: 0 days = 1.0, 30 days = 0.5, 90 days = 0.1
-                score = math.exp(-days_old / 30)
-                recency_scores.append(score)
+                days_old.append((now - created_at).days)
 
-        if not recency_scores:
+        if not days_old:
             return 0.5  # Default if no dates
 
-        return sum(recency_scores) / len(recency_scores)
+        # Decay: 0 days = 1.0, 30 days = 0.5, 90 days = 0.1
+        return float(np.exp(np.array(days_old, dtype=np.float64) / -30).mean())
 
     def _score_purchase_intent(self, mentions: List[Dict]) -> float:
         """
@@ -131,11 +150,6 @@ class ProductScorer:
         if not mentions:
             return 0.0
 
-        intent_keywords = [
-            "buy", "purchase", "recommend", "worth", "should i",
-            "looking for", "need", "want", "best", "alternative"
-        ]
-
         intent_count = 0
         negative_count = 0
 
@@ -143,11 +157,11 @@ class ProductScorer:
             content = (mention.get("content", "") + " " + mention.get("title", "")).lower()
 
             # Check for purchase intent
-            if any(kw in content for kw in intent_keywords):
+            if _INTENT_RE.search(content):
                 intent_count += 1
 
             # Check for warning signs
-            if any(kw in content for kw in ["don't buy", "avoid", "scam", "waste"]):
+            if _WARNING_RE.search(content):
                 negative_count += 1
 
         if not mentions:
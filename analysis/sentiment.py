@@ -3,9 +3,61 @@ Sentiment analysis module using VADER (optimized for social media).
 """
 
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple, Sequence
+import numpy as np
 import re
 
+LABEL_CODES = {"positive": 1, "negative": -1, "neutral": 0}
+
+# Anything the markup-stripping regexes in _preprocess could match; texts
+# without it (most short comments) only need whitespace normalized
+_MARKUP_HINT_RE = re.compile(r"http|www\.|[\[*_]")
+
+# Markup stripped by _preprocess, compiled once instead of per call
+_URL_RE = re.compile(r"http\S+|www\.\S+")
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_MD_EMPHASIS_RE = re.compile(r"[*_]{1,2}([^*_]+)[*_]{1,2}")
+
+
+@lru_cache(maxsize=10_000)
+def _compound_score(analyzer: SentimentIntensityAnalyzer, text: str) -> float:
+    """
+    VADER compound score of preprocessed text.
+
+    Cached by content: the same posts and comments come back from
+    overlapping searches, and scoring is deterministic.
+    """
+    return analyzer.polarity_scores(text)["compound"]
+
+
+def aggregate_sentiment(
+    labeled: Sequence[Tuple[str, float]],
+    weights: Sequence[float]
+) -> Tuple[float, int, int]:
+    """
+    Reduce labeled sentiment results to weighted score and label counts.
+
+    Args:
+        labeled: (label, compound_score) tuples, e.g. from get_sentiment_labels_batch
+        weights: Per-text weight (e.g. upvotes), same length as labeled
+
+    Returns:
+        Tuple of (weighted_sentiment, positive_count, negative_count)
+    """
+    n = len(labeled)
+    if n == 0:
+        return 0.0, 0, 0
+
+    scores = np.fromiter((score for _, score in labeled), dtype=np.float64, count=n)
+    labels = np.fromiter((LABEL_CODES[label] for label, _ in labeled), dtype=np.int8, count=n)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    total_weight = weights.sum()
+    weighted_sentiment = float((scores * weights).sum() / total_weight) if total_weight > 0 else 0.0
+
+    return weighted_sentiment, int((labels == 1).sum()), int((labels == -1).sum())
+
 
 class SentimentAnalyzer:
     """
@@ -13,13 +65,20 @@ class SentimentAnalyzer:
     VADER is specifically tuned for social media content.
     """
 
+    # VADER analyzer shared by all instances (lexicon is loaded once per process)
+    _shared_analyzer = None
+
     def __init__(self):
-        self.analyzer = SentimentIntensityAnalyzer()
+        if SentimentAnalyzer._shared_analyzer is None:
+            analyzer = SentimentIntensityAnalyzer()
+            # Custom words relevant to product reviews
+            self._add_custom_lexicon(analyzer)
+            SentimentAnalyzer._shared_analyzer = analyzer
 
-        # Custom words relevant to product reviews
-        self._add_custom_lexicon()
+        self.analyzer = SentimentAnalyzer._shared_analyzer
 
-    def _add_custom_lexicon(self):
+    @staticmethod
+    def _add_custom_lexicon(analyzer: SentimentIntensityAnalyzer):
         """Add product-review specific words to VADER's lexicon."""
         custom_words = {
             # Positive product words
@@ -58,8 +117,7 @@ class SentimentAnalyzer:
             "buyer beware": -2.5,
         }
 
-        for word, score in custom_words.items():
-            self.analyzer.lexicon[word] = score
+        analyzer.lexicon.update(custom_words)
 
     def analyze(self, text: str) -> Dict[str, float]:
         """
@@ -109,21 +167,52 @@ class SentimentAnalyzer:
 
     def _preprocess(self, text: str) -> str:
         """Preprocess text for better sentiment analysis."""
+        # Fast path: plain text has no URLs or markdown to strip
+        if _MARKUP_HINT_RE.search(text) is None:
+            return " ".join(text.split())
+
         # Convert to lowercase but preserve emoticons
         text = text.strip()
 
         # Remove URLs
-        text = re.sub(r"http\S+|www\.\S+", "", text)
+        text = _URL_RE.sub("", text)
 
         # Remove Reddit-specific markdown
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)  # Links
-        text = re.sub(r"[*_]{1,2}([^*_]+)[*_]{1,2}", r"\1", text)  # Bold/italic
+        text = _MD_LINK_RE.sub(r"\1", text)  # Links
+        text = _MD_EMPHASIS_RE.sub(r"\1", text)  # Bold/italic
 
         # Normalize whitespace
         text = " ".join(text.split())
 
         return text
 
+    def get_sentiment_labels_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """
+        Get sentiment labels and scores for many texts in one call.
+
+        VADER has no batched kernel, so this amortizes the per-call overhead
+        instead: method lookups are hoisted, the loop is a single list comp,
+        and texts seen before are served from a content-keyed LRU cache.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of (label, compound_score) tuples, in input order
+        """
+        analyzer = self.analyzer
+        preprocess = self._preprocess
+
+        compounds = [
+            _compound_score(analyzer, preprocess(text)) if text else 0
+            for text in texts
+        ]
+
+        return [
+            ("positive" if c >= 0.05 else "negative" if c <= -0.05 else "neutral", c)
+            for c in compounds
+        ]
+
     def analyze_batch(self, texts: list) -> list:
         """
         Analyze sentiment of multiple texts.
@@ -134,7 +223,7 @@ class SentimentAnalyzer:
         Returns:
             List of (label, score) tuples
         """
-        return [self.get_sentiment_label(text) for text in texts]
+        return self.get_sentiment_labels_batch(texts)
 
     def get_summary_stats(self, texts: list) -> Dict[str, float]:
         """
@@ -258,7 +258,8 @@ def load_scrapers():
 def discover_niches(categories, max_products, niche_types=None, include_amazon_sentiment=True, progress_callback=None):
     """Discover product opportunities from real Google Trends data."""
     from discovery.trends_to_products_finder import TrendsToProductsFinder
-    finder = TrendsToProductsFinder()
+    # The UI reports progress through progress_callback
+    finder = TrendsToProductsFinder(verbose=progress_callback is None)
 
     if niche_types is None:
         niche_types = ["accessories", "alternatives", "complementary"]
@@ -275,6 +276,7 @@ def discover_niches(categories, max_products, niche_types=None, include_amazon_s
 
 def research_products(products, skip_trends=True, progress_callback=None):
     """Research a list of products."""
+    from analysis import aggregate_sentiment
     tools = load_scrapers()
     results = []
 
@@ -308,23 +310,12 @@ def research_products(products, skip_trends=True, progress_callback=None):
         try:
             posts = tools['reddit'].search_all_reddit(product_name, limit=20)
             if posts:
-                sentiments = []
-                for post in posts:
-                    text = f"{post.get('title', '')} {post.get('content', '')}"
-                    label, score = tools['sentiment'].get_sentiment_label(text)
-                    sentiments.append({
-                        'label': label,
-                        'score': score,
-                        'upvotes': post.get('upvotes', 0)
-                    })
-
-                total_weight = sum(max(s['upvotes'], 1) for s in sentiments)
-                weighted_sentiment = sum(
-                    s['score'] * max(s['upvotes'], 1) for s in sentiments
-                ) / total_weight if total_weight > 0 else 0
-
-                positive_count = sum(1 for s in sentiments if s['label'] == 'positive')
-                negative_count = sum(1 for s in sentiments if s['label'] == 'negative')
+                labeled = tools['sentiment'].get_sentiment_labels_batch([
+                    f"{post.get('title', '')} {post.get('content', '')}" for post in posts
+                ])
+                weighted_sentiment, positive_count, negative_count = aggregate_sentiment(
+                    labeled, [max(post.get('upvotes', 0), 1) for post in posts]
+                )
 
                 result['reddit_posts'] = len(posts)
                 result['reddit_sentiment'] = round(weighted_sentiment, 3)
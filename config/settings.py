@@ -112,6 +112,11 @@ SCORING_WEIGHTS = {
 # Database settings
 DATABASE_PATH = "data/products.db"
 
+# Persistent cache for scraper results (reused across runs)
+CACHE_PATH = "data/cache.db"
+TRENDS_CACHE_TTL = 24 * 3600  # Trends data only changes daily
+REDDIT_CACHE_TTL = 3600  # Search results pick up new posts quickly
+
 # Reporting settings
 REPORT_SETTINGS = {
     "top_products": 20,  # Number of top products to show in reports
@@ -1,2 +1,2 @@
 from .db import Database
-from .models import Product, Mention, ScrapingLog, TrendSnapshot, DiscoveryRun, ProductSnapshot
+from .models import Product, Mention, ScrapingLog, TrendSnapshot, DiscoveryRun, ProductSnapshot, ProductMetric
@@ -3,27 +3,88 @@ Database operations and session management.
 """
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+from functools import lru_cache
+from sqlalchemy import create_engine, select, insert, func, case, literal, or_
+from sqlalchemy.orm import sessionmaker, scoped_session, selectinload
+from sqlalchemy.schema import CreateIndex
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from .models import Base, Product, Mention, ScrapingLog, TrendSnapshot, DiscoveryRun, ProductSnapshot
+from .models import Base, PRODUCT_LOWER_NAME_INDEX, Product, Mention, ScrapingLog, TrendSnapshot, DiscoveryRun, ProductSnapshot, ProductMetric
 import json
 import re
 
+# Look-back windows precomputed into product_metrics (None = all history)
+METRIC_WINDOWS = {"7d": 7, "30d": 30, "all": None}
+
+# Connection pool settings shared by every Database instance on the same file
+POOL_SETTINGS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+}
+
+# Rows written per transaction in bulk operations
+WRITE_BATCH_SIZE = 10_000
+
+_engines = {}
+
+_SIZE_RE = re.compile(r'\d+\s*(oz|ml|inch|pack|count|lb|kg|piece|set|mm|cm)\b', re.IGNORECASE)
+_PARENS_RE = re.compile(r'\([^)]*\)')
+_BRACKETS_RE = re.compile(r'\[[^\]]*\]')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_SPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=100_000)
+def normalize(name: str) -> str:
+    """
+    Canonical product-name normalization used for matching across runs.
+
+    Lowercases, drops size/quantity info, parenthesized/bracketed content and
+    punctuation, then keeps the first 5 words. Cached since the same names
+    recur across every discovery run.
+    """
+    name = name.lower().strip()
+    name = _SIZE_RE.sub('', name)
+    name = _PARENS_RE.sub('', name)
+    name = _BRACKETS_RE.sub('', name)
+    name = _PUNCT_RE.sub('', name)
+    name = _SPACE_RE.sub(' ', name).strip()
+    return ' '.join(name.split()[:5])
+
+
+def get_engine(db_path: str = "data/products.db"):
+    """Get the shared engine (and connection pool) for a database file."""
+    engine = _engines.get(db_path)
+    if engine is None:
+        engine = create_engine(f"sqlite:///{db_path}", echo=False, **POOL_SETTINGS)
+        Base.metadata.create_all(engine)
+        # Not added by create_all to a products table from before the index existed
+        # (checkfirst can't reflect expression indexes on SQLite, so IF NOT EXISTS)
+        with engine.begin() as conn:
+            conn.execute(CreateIndex(PRODUCT_LOWER_NAME_INDEX, if_not_exists=True))
+        _engines[db_path] = engine
+    return engine
+
 
 class Database:
     """Handle all database operations."""
 
-    def __init__(self, db_path: str = "data/products.db"):
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
-        Base.metadata.create_all(self.engine)
-
-        session_factory = sessionmaker(bind=self.engine)
+    def __init__(self, db_path: str = "data/products.db", session_factory: sessionmaker = None):
+        """
+        Args:
+            db_path: SQLite database file (ignored if session_factory is given)
+            session_factory: Shared sessionmaker to reuse an existing connection pool
+        """
+        if session_factory is None:
+            # Ensure data directory exists
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            session_factory = sessionmaker(bind=get_engine(db_path))
+
+        self.engine = session_factory.kw["bind"]
+        self.session_factory = session_factory
         self.Session = scoped_session(session_factory)
 
     def get_session(self):
@@ -42,7 +103,10 @@ class Database:
         # Normalize product name
         normalized_name = name.lower().strip()
 
+        # Exact match first (uses ix_product_lower_name), then substring
         product = session.query(Product).filter(
+            func.lower(Product.name) == normalized_name
+        ).first() or session.query(Product).filter(
             Product.name.ilike(f"%{normalized_name}%")
         ).first()
 
@@ -63,13 +127,15 @@ class Database:
         product = session.query(Product).get(product_id)
 
         if product:
-            mentions = session.query(Mention).filter(
-                Mention.product_id == product_id
-            ).all()
-
-            product.total_mentions = len(mentions)
-            if mentions:
-                product.avg_sentiment = sum(m.sentiment_score or 0 for m in mentions) / len(mentions)
+            # Count and average in SQL instead of loading every mention row
+            mention_count, avg_sentiment = session.query(
+                func.count(Mention.id),
+                func.avg(func.coalesce(Mention.sentiment_score, 0))
+            ).filter(Mention.product_id == product_id).one()
+
+            product.total_mentions = mention_count
+            if mention_count:
+                product.avg_sentiment = avg_sentiment
             product.last_seen = datetime.utcnow()
 
             session.commit()
@@ -102,6 +168,68 @@ class Database:
 
         return mention
 
+    def bulk_add_mentions(self, mentions: List[Tuple[int, dict]]) -> int:
+        """
+        Add many mentions, one transaction per batch.
+
+        Mentions already stored (same platform_id and source) or repeated in
+        the input are skipped, like add_mention. Existing keys are looked up
+        with one query per batch, new rows are flushed together, and each
+        affected product's stats are recalculated once per batch rather than
+        once per mention.
+
+        Args:
+            mentions: (product_id, mention_data) pairs
+
+        Returns:
+            Number of mentions added
+        """
+        count = 0
+        for start in range(0, len(mentions), WRITE_BATCH_SIZE):
+            batch = mentions[start:start + WRITE_BATCH_SIZE]
+            with self.session_factory.begin() as session:
+                platform_ids = {data.get("platform_id") for _, data in batch}
+                condition = Mention.platform_id.in_(platform_ids - {None})
+                if None in platform_ids:
+                    condition = or_(condition, Mention.platform_id.is_(None))
+                seen = set(session.execute(
+                    select(Mention.platform_id, Mention.source).where(condition)
+                ).tuples())
+
+                new_mentions = []
+                for product_id, data in batch:
+                    key = (data.get("platform_id"), data.get("source"))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    new_mentions.append(Mention(product_id=product_id, **data))
+
+                if not new_mentions:
+                    continue
+                session.add_all(new_mentions)
+                session.flush()
+                count += len(new_mentions)
+
+                # Same stats as update_product_stats, for all touched products at once
+                product_ids = {m.product_id for m in new_mentions}
+                stats = {
+                    product_id: (mention_count, avg_sentiment)
+                    for product_id, mention_count, avg_sentiment in session.execute(
+                        select(
+                            Mention.product_id,
+                            func.count(Mention.id),
+                            func.avg(func.coalesce(Mention.sentiment_score, 0))
+                        )
+                        .where(Mention.product_id.in_(product_ids))
+                        .group_by(Mention.product_id)
+                    )
+                }
+                now = datetime.utcnow()
+                for product in session.scalars(select(Product).where(Product.id.in_(product_ids))):
+                    product.total_mentions, product.avg_sentiment = stats[product.id]
+                    product.last_seen = now
+        return count
+
     # Logging operations
     def create_scraping_log(self, source: str, subreddit: str = None) -> ScrapingLog:
         """Create a new scraping log entry."""
@@ -189,20 +317,7 @@ class Database:
 
     def normalize_product_name(self, name: str) -> str:
         """Create a normalized version of product name for matching across runs."""
-        name = name.lower().strip()
-        # Remove size/quantity info
-        name = re.sub(r'\d+\s*(oz|ml|inch|pack|count|lb|kg|piece|set|mm|cm)\b', '', name, flags=re.IGNORECASE)
-        # Remove parentheses content
-        name = re.sub(r'\([^)]*\)', '', name)
-        # Remove brackets content
-        name = re.sub(r'\[[^\]]*\]', '', name)
-        # Remove special characters
-        name = re.sub(r'[^\w\s]', '', name)
-        # Clean whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
-        # Take first 5 words for matching
-        words = name.split()[:5]
-        return ' '.join(words)
+        return normalize(name)
 
     def create_discovery_run(self, mode: str, categories: List[str] = None, settings: dict = None) -> DiscoveryRun:
         """Create a new discovery run record."""
@@ -241,7 +356,9 @@ class Database:
     def get_run_products(self, run_id: int) -> List[ProductSnapshot]:
         """Get all product snapshots for a specific run."""
         session = self.get_session()
-        return session.query(ProductSnapshot).filter(
+        return session.query(ProductSnapshot).options(
+            selectinload(ProductSnapshot.product)
+        ).filter(
             ProductSnapshot.discovery_run_id == run_id
         ).order_by(ProductSnapshot.opportunity_score.desc()).all()
 
@@ -249,9 +366,16 @@ class Database:
     # Product Tracking
     # =========================================================================
 
-    def get_or_create_product_by_name(self, name: str, category: str = None) -> Product:
-        """Find product by normalized name or create new one."""
-        session = self.get_session()
+    def get_or_create_product_by_name(self, name: str, category: str = None, session=None) -> Product:
+        """
+        Find product by normalized name or create new one.
+
+        If a session is passed, the new product is flushed into that session's
+        transaction instead of committed.
+        """
+        owns_session = session is None
+        if owns_session:
+            session = self.get_session()
         normalized = self.normalize_product_name(name)
 
         product = session.query(Product).filter(
@@ -268,18 +392,29 @@ class Database:
                 lowest_score=100.0
             )
             session.add(product)
-            session.commit()
+            if owns_session:
+                session.commit()
+            else:
+                session.flush()
 
         return product
 
-    def save_product_snapshot(self, run_id: int, product_data: dict) -> ProductSnapshot:
-        """Save a product snapshot for a discovery run."""
-        session = self.get_session()
+    def save_product_snapshot(self, run_id: int, product_data: dict, session=None) -> ProductSnapshot:
+        """
+        Save a product snapshot for a discovery run.
+
+        If a session is passed, the snapshot joins that session's transaction
+        and the caller is responsible for committing.
+        """
+        owns_session = session is None
+        if owns_session:
+            session = self.get_session()
 
         # Get or create the Product record
         product = self.get_or_create_product_by_name(
             product_data.get('name', ''),
-            product_data.get('category')
+            product_data.get('category'),
+            session=session
         )
 
         score = product_data.get('opportunity_score', 0)
@@ -310,21 +445,104 @@ class Database:
             combined_sentiment=product_data.get('combined_sentiment', 0)
         )
         session.add(snapshot)
-        session.commit()
+        if owns_session:
+            session.commit()
 
         return snapshot
 
     def bulk_save_snapshots(self, run_id: int, products: List[dict]) -> int:
-        """Save multiple product snapshots efficiently."""
+        """
+        Save multiple product snapshots, one transaction per batch.
+
+        Each batch resolves its Product rows with one SELECT (plus one flush for
+        any new products) and writes all snapshots with a single executemany
+        INSERT, instead of a query and insert per product.
+        """
         count = 0
-        for product_data in products:
-            try:
-                self.save_product_snapshot(run_id, product_data)
-                count += 1
-            except Exception as e:
-                print(f"Error saving snapshot for {product_data.get('name', 'unknown')}: {e}")
+        for start in range(0, len(products), WRITE_BATCH_SIZE):
+            batch = products[start:start + WRITE_BATCH_SIZE]
+            with self.session_factory.begin() as session:
+                by_name = self._resolve_products(session, batch)
+                now = datetime.utcnow()
+
+                rows = []
+                for product_data in batch:
+                    try:
+                        product = by_name[normalize(product_data.get('name', ''))]
+                        score = product_data.get('opportunity_score', 0)
+
+                        # Update Product tracking fields
+                        product.times_seen += 1
+                        product.last_seen = now
+                        product.opportunity_score = score
+                        product.avg_sentiment = product_data.get('reddit_sentiment', 0)
+
+                        if score > product.highest_score:
+                            product.highest_score = score
+                        if score < product.lowest_score:
+                            product.lowest_score = score
+
+                        rows.append({
+                            "discovery_run_id": run_id,
+                            "product_id": product.id,
+                            "opportunity_score": score,
+                            "reddit_sentiment": product_data.get('reddit_sentiment', 0),
+                            "sentiment_ratio": product_data.get('sentiment_ratio', 0),
+                            "reddit_posts": product_data.get('reddit_posts', 0),
+                            "amazon_review_count": product_data.get('amazon_review_count', 0),
+                            "price": str(product_data.get('price', '')),
+                            "niche_type": product_data.get('niche_type', ''),
+                            "trend_direction": product_data.get('trend_direction', ''),
+                            "combined_sentiment": product_data.get('combined_sentiment', 0),
+                        })
+                    except Exception as e:
+                        print(f"Error saving snapshot for {product_data.get('name', 'unknown')}: {e}")
+
+                if rows:
+                    session.execute(insert(ProductSnapshot), rows)
+                count += len(rows)
         return count
 
+    def _resolve_products(self, session, products: List[dict]) -> dict:
+        """
+        Map each product's normalized name to its Product row, creating missing ones.
+
+        Returns:
+            Dict of normalized name -> Product (new products are flushed so they have ids)
+        """
+        names = {}
+        for product_data in products:
+            name = product_data.get('name', '')
+            names.setdefault(normalize(name), (name, product_data.get('category')))
+
+        by_name = {}
+        existing = session.scalars(
+            select(Product)
+            .where(Product.normalized_name.in_(names))
+            .order_by(Product.id)
+        )
+        for product in existing:
+            by_name.setdefault(product.normalized_name, product)
+
+        new_products = [
+            Product(
+                name=name,
+                normalized_name=normalized,
+                category=category,
+                times_seen=0,
+                highest_score=0.0,
+                lowest_score=100.0
+            )
+            for normalized, (name, category) in names.items()
+            if normalized not in by_name
+        ]
+        if new_products:
+            session.add_all(new_products)
+            session.flush()
+            by_name.update((p.normalized_name, p) for p in new_products)
+
+        return by_name
+
     # =========================================================================
     # Historical Analysis
     # =========================================================================
@@ -332,7 +550,9 @@ class Database:
     def get_product_history(self, product_id: int, limit: int = 30) -> List[ProductSnapshot]:
         """Get score history for a product across runs."""
         session = self.get_session()
-        return session.query(ProductSnapshot).filter(
+        return session.query(ProductSnapshot).options(
+            selectinload(ProductSnapshot.discovery_run)
+        ).filter(
             ProductSnapshot.product_id == product_id
         ).order_by(ProductSnapshot.id.desc()).limit(limit).all()
 
@@ -355,13 +575,17 @@ class Database:
         # Get snapshots for both runs
         snapshots_1 = {
             s.product.normalized_name: s
-            for s in session.query(ProductSnapshot).filter(
+            for s in session.query(ProductSnapshot).options(
+                selectinload(ProductSnapshot.product)
+            ).filter(
                 ProductSnapshot.discovery_run_id == run_id_1
             ).all()
         }
         snapshots_2 = {
             s.product.normalized_name: s
-            for s in session.query(ProductSnapshot).filter(
+            for s in session.query(ProductSnapshot).options(
+                selectinload(ProductSnapshot.product)
+            ).filter(
                 ProductSnapshot.discovery_run_id == run_id_2
             ).all()
         }
@@ -436,3 +660,96 @@ class Database:
         return session.query(Product).filter(
             Product.times_seen > 0
         ).order_by(Product.times_seen.desc()).limit(limit).all()
+
+    # =========================================================================
+    # Aggregate Metrics
+    # =========================================================================
+
+    def refresh_product_metrics(self) -> int:
+        """
+        Recompute the product_metrics table from snapshot history.
+
+        SQLite has no materialized views, so the aggregates are rebuilt with
+        one INSERT ... SELECT ... GROUP BY per window at the end of each run.
+        Dashboards then read a single row instead of scanning all snapshots.
+
+        Returns:
+            Number of metric rows written
+        """
+        session = self.get_session()
+        now = datetime.utcnow()
+
+        session.query(ProductMetric).delete()
+
+        for period, days in METRIC_WINDOWS.items():
+            scored = select(
+                ProductSnapshot.product_id.label("product_id"),
+                Product.category.label("category"),
+                ProductSnapshot.opportunity_score.label("score"),
+                # x = appearance number, for the least-squares slope
+                func.row_number().over(
+                    partition_by=ProductSnapshot.product_id,
+                    order_by=DiscoveryRun.run_timestamp
+                ).label("x"),
+                func.cume_dist().over(
+                    partition_by=ProductSnapshot.product_id,
+                    order_by=ProductSnapshot.opportunity_score
+                ).label("pct"),
+            ).join(
+                Product, Product.id == ProductSnapshot.product_id
+            ).join(
+                DiscoveryRun, DiscoveryRun.id == ProductSnapshot.discovery_run_id
+            ).where(
+                ProductSnapshot.opportunity_score.isnot(None)
+            )
+
+            if days is not None:
+                scored = scored.where(DiscoveryRun.run_timestamp >= now - timedelta(days=days))
+
+            scored = scored.subquery()
+
+            n = func.count()
+            sum_x = func.sum(scored.c.x)
+            sum_y = func.sum(scored.c.score)
+            denom = n * func.sum(scored.c.x * scored.c.x) - sum_x * sum_x
+            slope = case(
+                (denom == 0, 0.0),
+                else_=(n * func.sum(scored.c.x * scored.c.score) - sum_x * sum_y) * 1.0 / denom
+            )
+
+            aggregate = select(
+                scored.c.product_id,
+                scored.c.category,
+                literal(period),
+                func.avg(scored.c.score),
+                func.min(case((scored.c.pct >= 0.95, scored.c.score))),
+                slope,
+                n,
+                literal(now),
+            ).group_by(scored.c.product_id, scored.c.category)
+
+            session.execute(
+                insert(ProductMetric).from_select(
+                    ["product_id", "category", "period", "avg_score", "p95_score",
+                     "trend_slope", "snapshot_count", "refreshed_at"],
+                    aggregate
+                )
+            )
+
+        session.commit()
+        return session.query(ProductMetric).count()
+
+    def get_product_metrics(self, product_id: int) -> List[ProductMetric]:
+        """Get precomputed metrics for a product across all windows."""
+        session = self.get_session()
+        return session.query(ProductMetric).filter(
+            ProductMetric.product_id == product_id
+        ).all()
+
+    def get_top_metrics(self, period: str = "30d", category: str = None, limit: int = 20) -> List[ProductMetric]:
+        """Get products with the highest average score in a window."""
+        session = self.get_session()
+        query = session.query(ProductMetric).filter(ProductMetric.period == period)
+        if category:
+            query = query.filter(ProductMetric.category == category)
+        return query.order_by(ProductMetric.avg_score.desc()).limit(limit).all()
@@ -2,62 +2,69 @@
 Database models for storing scraped data and analysis results.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, Text, ForeignKey, UniqueConstraint, Index, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import Optional, List
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    pass
 
 
 class Product(Base):
     """Tracked products/items mentioned across platforms."""
     __tablename__ = "products"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String(255), nullable=False, index=True)
-    normalized_name = Column(String(255), index=True, unique=True)  # For matching across runs
-    category = Column(String(100), index=True)
-    first_seen = Column(DateTime, default=datetime.utcnow)
-    last_seen = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    total_mentions = Column(Integer, default=0)
-    avg_sentiment = Column(Float, default=0.0)
-    opportunity_score = Column(Float, default=0.0)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), index=True)
+    normalized_name: Mapped[Optional[str]] = mapped_column(String(255), index=True, unique=True)  # For matching across runs
+    category: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    first_seen: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    last_seen: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow)
+    total_mentions: Mapped[Optional[int]] = mapped_column(default=0)
+    avg_sentiment: Mapped[Optional[float]] = mapped_column(default=0.0)
+    opportunity_score: Mapped[Optional[float]] = mapped_column(default=0.0)
 
     # Tracking fields for historical analysis
-    times_seen = Column(Integer, default=1)  # How many discovery runs it appeared in
-    highest_score = Column(Float, default=0.0)
-    lowest_score = Column(Float, default=100.0)
+    times_seen: Mapped[Optional[int]] = mapped_column(default=1)  # How many discovery runs it appeared in
+    highest_score: Mapped[Optional[float]] = mapped_column(default=0.0)
+    lowest_score: Mapped[Optional[float]] = mapped_column(default=100.0)
 
-    mentions = relationship("Mention", back_populates="product")
-    snapshots = relationship("ProductSnapshot", back_populates="product")
+    mentions: Mapped[List["Mention"]] = relationship(back_populates="product")
+    snapshots: Mapped[List["ProductSnapshot"]] = relationship(back_populates="product")
 
     def __repr__(self):
         return f"<Product(name='{self.name}', score={self.opportunity_score:.2f})>"
 
 
+# Functional index backing case-insensitive name lookups (legacy rows without normalized_name).
+# create_all skips indexes on tables that already exist, so get_engine also creates it.
+PRODUCT_LOWER_NAME_INDEX = Index("ix_product_lower_name", func.lower(Product.name))
+
+
 class Mention(Base):
     """Individual mentions of products in posts/comments."""
     __tablename__ = "mentions"
 
-    id = Column(Integer, primary_key=True)
-    product_id = Column(Integer, ForeignKey("products.id"), index=True)
-    source = Column(String(50))  # reddit, amazon, etc.
-    platform_id = Column(String(100))  # Original post/comment ID
-    subreddit = Column(String(100), index=True)
-    title = Column(Text)
-    content = Column(Text)
-    url = Column(String(500))
-    author = Column(String(100))
-    upvotes = Column(Integer, default=0)
-    comments_count = Column(Integer, default=0)
-    sentiment_score = Column(Float)
-    sentiment_label = Column(String(20))  # positive, negative, neutral
-    is_post = Column(Boolean, default=True)  # True for post, False for comment
-    created_at = Column(DateTime)
-    scraped_at = Column(DateTime, default=datetime.utcnow)
-
-    product = relationship("Product", back_populates="mentions")
+    id: Mapped[int] = mapped_column(primary_key=True)
+    product_id: Mapped[Optional[int]] = mapped_column(ForeignKey("products.id"), index=True)
+    source: Mapped[Optional[str]] = mapped_column(String(50))  # reddit, amazon, etc.
+    platform_id: Mapped[Optional[str]] = mapped_column(String(100))  # Original post/comment ID
+    subreddit: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    title: Mapped[Optional[str]] = mapped_column(Text)
+    content: Mapped[Optional[str]] = mapped_column(Text)
+    url: Mapped[Optional[str]] = mapped_column(String(500))
+    author: Mapped[Optional[str]] = mapped_column(String(100))
+    upvotes: Mapped[Optional[int]] = mapped_column(default=0)
+    comments_count: Mapped[Optional[int]] = mapped_column(default=0)
+    sentiment_score: Mapped[Optional[float]] = mapped_column()
+    sentiment_label: Mapped[Optional[str]] = mapped_column(String(20))  # positive, negative, neutral
+    is_post: Mapped[Optional[bool]] = mapped_column(default=True)  # True for post, False for comment
+    created_at: Mapped[Optional[datetime]] = mapped_column()
+    scraped_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+
+    product: Mapped[Optional["Product"]] = relationship(back_populates="mentions")
 
     def __repr__(self):
         return f"<Mention(source='{self.source}', sentiment={self.sentiment_label})>"
@@ -67,15 +74,15 @@ class ScrapingLog(Base):
     """Log of scraping sessions for tracking and debugging."""
     __tablename__ = "scraping_logs"
 
-    id = Column(Integer, primary_key=True)
-    source = Column(String(50))
-    subreddit = Column(String(100))
-    posts_scraped = Column(Integer, default=0)
-    comments_scraped = Column(Integer, default=0)
-    products_found = Column(Integer, default=0)
-    errors = Column(Text)
-    started_at = Column(DateTime, default=datetime.utcnow)
-    completed_at = Column(DateTime)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    source: Mapped[Optional[str]] = mapped_column(String(50))
+    subreddit: Mapped[Optional[str]] = mapped_column(String(100))
+    posts_scraped: Mapped[Optional[int]] = mapped_column(default=0)
+    comments_scraped: Mapped[Optional[int]] = mapped_column(default=0)
+    products_found: Mapped[Optional[int]] = mapped_column(default=0)
+    errors: Mapped[Optional[str]] = mapped_column(Text)
+    started_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    completed_at: Mapped[Optional[datetime]] = mapped_column()
 
     def __repr__(self):
         return f"<ScrapingLog(source='{self.source}', posts={self.posts_scraped})>"
@@ -85,12 +92,12 @@ class TrendSnapshot(Base):
     """Daily snapshots for tracking trends over time."""
     __tablename__ = "trend_snapshots"
 
-    id = Column(Integer, primary_key=True)
-    product_id = Column(Integer, ForeignKey("products.id"), index=True)
-    date = Column(DateTime, default=datetime.utcnow, index=True)
-    daily_mentions = Column(Integer, default=0)
-    daily_sentiment = Column(Float)
-    trending_score = Column(Float)  # Calculated based on growth
+    id: Mapped[int] = mapped_column(primary_key=True)
+    product_id: Mapped[Optional[int]] = mapped_column(ForeignKey("products.id"), index=True)
+    date: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow, index=True)
+    daily_mentions: Mapped[Optional[int]] = mapped_column(default=0)
+    daily_sentiment: Mapped[Optional[float]] = mapped_column()
+    trending_score: Mapped[Optional[float]] = mapped_column()  # Calculated based on growth
 
     def __repr__(self):
         return f"<TrendSnapshot(date='{self.date}', mentions={self.daily_mentions})>"
@@ -100,17 +107,17 @@ class DiscoveryRun(Base):
     """Track each discovery session for historical comparison."""
     __tablename__ = "discovery_runs"
 
-    id = Column(Integer, primary_key=True)
-    run_timestamp = Column(DateTime, default=datetime.utcnow, index=True)
-    mode = Column(String(50))  # "discover", "custom_keywords", "manual", "amazon_trending"
-    categories = Column(Text)  # JSON list of categories used
-    settings = Column(Text)  # JSON of settings (max_products, niche_types, etc.)
-    products_found = Column(Integer, default=0)
-    avg_score = Column(Float, default=0.0)
-    duration_seconds = Column(Integer)  # How long the run took
+    id: Mapped[int] = mapped_column(primary_key=True)
+    run_timestamp: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow, index=True)
+    mode: Mapped[Optional[str]] = mapped_column(String(50))  # "discover", "custom_keywords", "manual", "amazon_trending"
+    categories: Mapped[Optional[str]] = mapped_column(Text)  # JSON list of categories used
+    settings: Mapped[Optional[str]] = mapped_column(Text)  # JSON of settings (max_products, niche_types, etc.)
+    products_found: Mapped[Optional[int]] = mapped_column(default=0)
+    avg_score: Mapped[Optional[float]] = mapped_column(default=0.0)
+    duration_seconds: Mapped[Optional[int]] = mapped_column()  # How long the run took
 
     # Relationship to products found in this run
-    snapshots = relationship("ProductSnapshot", back_populates="discovery_run")
+    snapshots: Mapped[List["ProductSnapshot"]] = relationship(back_populates="discovery_run")
 
     def __repr__(self):
         return f"<DiscoveryRun(id={self.id}, timestamp='{self.run_timestamp}', products={self.products_found})>"
@@ -120,24 +127,47 @@ class ProductSnapshot(Base):
     """Snapshot of product state at each discovery run."""
     __tablename__ = "product_snapshots"
 
-    id = Column(Integer, primary_key=True)
-    discovery_run_id = Column(Integer, ForeignKey("discovery_runs.id"), index=True)
-    product_id = Column(Integer, ForeignKey("products.id"), index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    discovery_run_id: Mapped[Optional[int]] = mapped_column(ForeignKey("discovery_runs.id"), index=True)
+    product_id: Mapped[Optional[int]] = mapped_column(ForeignKey("products.id"), index=True)
 
     # Snapshot data (captured at this point in time)
-    opportunity_score = Column(Float)
-    reddit_sentiment = Column(Float)
-    sentiment_ratio = Column(Float)
-    reddit_posts = Column(Integer)
-    amazon_review_count = Column(Integer)
-    price = Column(String(50))
-    niche_type = Column(String(50))
-    trend_direction = Column(String(20))
-    combined_sentiment = Column(Float)
+    opportunity_score: Mapped[Optional[float]] = mapped_column()
+    reddit_sentiment: Mapped[Optional[float]] = mapped_column()
+    sentiment_ratio: Mapped[Optional[float]] = mapped_column()
+    reddit_posts: Mapped[Optional[int]] = mapped_column()
+    amazon_review_count: Mapped[Optional[int]] = mapped_column()
+    price: Mapped[Optional[str]] = mapped_column(String(50))
+    niche_type: Mapped[Optional[str]] = mapped_column(String(50))
+    trend_direction: Mapped[Optional[str]] = mapped_column(String(20))
+    combined_sentiment: Mapped[Optional[float]] = mapped_column()
 
     # Relationships
-    discovery_run = relationship("DiscoveryRun", back_populates="snapshots")
-    product = relationship("Product", back_populates="snapshots")
+    discovery_run: Mapped[Optional["DiscoveryRun"]] = relationship(back_populates="snapshots")
+    product: Mapped[Optional["Product"]] = relationship(back_populates="snapshots")
 
     def __repr__(self):
         return f"<ProductSnapshot(product_id={self.product_id}, score={self.opportunity_score})>"
+
+
+class ProductMetric(Base):
+    """Precomputed per-product aggregates, refreshed at the end of each discovery run."""
+    __tablename__ = "product_metrics"
+    __table_args__ = (
+        UniqueConstraint("product_id", "category", "period", name="uq_product_metric"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    product_id: Mapped[Optional[int]] = mapped_column(ForeignKey("products.id"), index=True)
+    category: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    period: Mapped[Optional[str]] = mapped_column(String(10), index=True)  # "7d", "30d", "all"
+    avg_score: Mapped[Optional[float]] = mapped_column()
+    p95_score: Mapped[Optional[float]] = mapped_column()
+    trend_slope: Mapped[Optional[float]] = mapped_column()  # Score change per appearance (least squares)
+    snapshot_count: Mapped[Optional[int]] = mapped_column(default=0)
+    refreshed_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+
+    product: Mapped[Optional["Product"]] = relationship()
+
+    def __repr__(self):
+        return f"<ProductMetric(product_id={self.product_id}, period='{self.period}', avg={self.avg_score})>"
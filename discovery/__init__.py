@@ -2,7 +2,7 @@
 from .trends_to_products_finder import TrendsToProductsFinder
 
 # Alternative finders (use Google Trends related queries)
-from .niche_finder import NicheFinder
+from .niche_finder import NicheFinder, ProductResult
 from .simple_niche_finder import SimpleNicheFinder
 
 # DEPRECATED - These use hardcoded product lists, not recommended
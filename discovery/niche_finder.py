@@ -3,12 +3,62 @@ Hidden Niche Discovery Engine
 Finds rising products with low competition and positive sentiment
 """
 
-import math
-from typing import List, Dict, Any
-from scrapers import TrendsScraper, RedditScraper
+import re
+import asyncio
+import heapq
+import threading
+from dataclasses import dataclass, asdict, fields
+from operator import attrgetter
+from typing import List, Dict, Any, Optional
+import numpy as np
+from scrapers import TrendsScraper, RedditScraper, create_http_session
 from scrapers.shopify_scraper import ShopifyScraper
 from scrapers.competition_checker import check_amazon_competition
 from analysis import SentimentAnalyzer
+from .reddit_sentiment import analyze_reddit_sentiment
+
+# Informational (non-product) search phrasing
+_SKIP_RE = re.compile(
+    r'\b(?:how to|what is|why|when|where|tutorials?|guides?|tips|best way|'
+    r'vs|versus|comparison|reviews?|near me|stores?|buy online)\b'
+)
+
+
+@dataclass(slots=True)
+class ProductResult:
+    """Analysis result for one product; defaults match a failed/empty lookup."""
+    name: str
+    source: str = "google_trends_rising"
+
+    # Google Trends
+    trend_score: float = 50
+    trend_direction: str = "unknown"
+    recent_interest: float = 0
+
+    # Amazon competition
+    amazon_results: int = 0
+    amazon_avg_reviews: int = 0
+    amazon_max_reviews: int = 0
+    amazon_avg_price: float = 0
+    amazon_saturation: str = "unknown"
+    amazon_score: float = 50
+
+    # Shopify competition
+    shopify_stores: int = 0
+    shopify_saturation: str = "unknown"
+    shopify_score: float = 50
+
+    # Reddit sentiment
+    reddit_posts: int = 0
+    reddit_sentiment: float = 0
+    reddit_positive: int = 0
+    reddit_negative: int = 0
+    sentiment_ratio: float = 0
+
+    opportunity_score: float = 0
+
+
+_RESULT_FIELDS = frozenset(f.name for f in fields(ProductResult))
 
 
 class NicheFinder:
@@ -20,24 +70,70 @@ class NicheFinder:
     """
 
     def __init__(self):
+        # One pooled keep-alive session shared by the HTTP scrapers
+        self.session = create_http_session()
+
         self.trends = TrendsScraper(delay=2.0)
-        self.shopify = ShopifyScraper(delay=2.0)
-        self.reddit = RedditScraper(delay=2.0)
+        self.shopify = ShopifyScraper(delay=2.0, session=self.session)
+        self.reddit = RedditScraper(delay=2.0, session=self.session)
         self.sentiment = SentimentAnalyzer()
 
+        # Per-domain limits so product-level concurrency doesn't stampede one host.
+        # pytrends keeps request state on the client, so Trends calls never overlap.
+        self._trends_sem = threading.Semaphore(1)
+        self._amazon_sem = threading.Semaphore(2)
+        self._shopify_sem = threading.Semaphore(4)
+        self._reddit_sem = threading.Semaphore(4)
+
+        # Reddit sentiment results keyed by query
+        self._reddit_cache: Dict[tuple, Dict[str, Any]] = {}
+
     def discover_niches(
         self,
         seed_keywords: List[str],
         max_products: int = 50,
-        progress_callback=None
+        progress_callback=None,
+        max_concurrency: int = 10,
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Discover hidden product niches (sync wrapper).
+
+        Args:
+            seed_keywords: Starting categories/keywords (e.g., ["kitchen", "fitness"])
+            max_products: Maximum products to analyze
+            progress_callback: Optional callback for progress updates
+            max_concurrency: Products analyzed at the same time
+            top_k: Only return the K best opportunities
+
+        Returns:
+            List of product opportunities sorted by score
+        """
+        return asyncio.run(self.discover_niches_async(
+            seed_keywords=seed_keywords,
+            max_products=max_products,
+            progress_callback=progress_callback,
+            max_concurrency=max_concurrency,
+            top_k=top_k
+        ))
+
+    async def discover_niches_async(
+        self,
+        seed_keywords: List[str],
+        max_products: int = 50,
+        progress_callback=None,
+        max_concurrency: int = 10,
+        top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Discover hidden product niches.
+        Discover hidden product niches, analyzing products concurrently.
 
         Args:
             seed_keywords: Starting categories/keywords (e.g., ["kitchen", "fitness"])
             max_products: Maximum products to analyze
             progress_callback: Optional callback for progress updates
+            max_concurrency: Products analyzed at the same time
+            top_k: Only return the K best opportunities
 
         Returns:
             List of product opportunities sorted by score
@@ -62,65 +158,77 @@ class NicheFinder:
         print("\n[STEP 2] Analyzing competition and sentiment...")
         print("-" * 50)
 
-        analyzed_products = []
+        sem = asyncio.BoundedSemaphore(max_concurrency)
+        total = len(rising_products)
+        completed = 0
+
+        async def analyze_and_report(product_name: str) -> ProductResult:
+            nonlocal completed
+            result = await self._analyze_one(product_name, sem)
+            completed += 1
 
-        for i, product_name in enumerate(rising_products):
             if progress_callback:
-                progress_callback(i, len(rising_products), product_name)
-
-            print(f"\n  [{i+1}/{len(rising_products)}] {product_name[:50]}")
-
-            result = {
-                "name": product_name,
-                "source": "google_trends_rising"
-            }
-
-            # 2a. Google Trends validation
-            print(f"    → Trends...", end=" ")
-            trend_data = self.trends.check_trend(product_name)
-            result["trend_score"] = trend_data.get("trend_score", 50)
-            result["trend_direction"] = trend_data.get("trend_direction", "unknown")
-            result["recent_interest"] = trend_data.get("recent_interest", 0)
-            print(f"{result['trend_direction']} ({result['trend_score']})")
-
-            # 2b. Amazon competition
-            print(f"    → Amazon...", end=" ")
-            amazon_data = check_amazon_competition(product_name)
-            result.update(amazon_data)
-            print(f"{amazon_data.get('amazon_saturation', 'unknown')} (score: {amazon_data.get('amazon_score', 0)})")
-
-            # 2c. Shopify competition
-            print(f"    → Shopify...", end=" ")
-            shopify_data = self.shopify.check_competition(product_name)
-            result.update(shopify_data)
-            print(f"{shopify_data.get('shopify_saturation', 'unknown')} ({shopify_data.get('shopify_stores', 0)} stores)")
-
-            # 2d. Reddit sentiment
-            print(f"    → Reddit...", end=" ")
-            reddit_data = self._get_reddit_sentiment(product_name)
-            result.update(reddit_data)
-
-            if reddit_data["reddit_posts"] > 0:
-                sent = reddit_data["reddit_sentiment"]
-                label = "positive" if sent > 0.05 else "negative" if sent < -0.05 else "neutral"
-                print(f"{reddit_data['reddit_posts']} posts, {label} ({sent:.2f})")
-            else:
-                print("no posts found")
+                progress_callback(completed, total, product_name)
+
+            print(f"  [{completed}/{total}] {product_name[:50]} → "
+                  f"trend {result.trend_direction}, "
+                  f"amazon {result.amazon_saturation}, "
+                  f"shopify {result.shopify_saturation}, "
+                  f"reddit {result.reddit_posts} posts")
+            return result
 
-            # Calculate opportunity score
-            result["opportunity_score"] = self._calculate_opportunity_score(result)
-            print(f"    ✓ Opportunity Score: {result['opportunity_score']:.1f}/100")
+        analyzed_products = await asyncio.gather(
+            *(analyze_and_report(p) for p in rising_products)
+        )
 
-            analyzed_products.append(result)
+        # Score every product in one vectorized pass
+        self._score_products(analyzed_products)
 
         # STEP 3: Sort and return top opportunities
         print("\n[STEP 3] Ranking opportunities...")
         print("-" * 50)
 
-        # Sort by opportunity score
-        analyzed_products.sort(key=lambda x: x["opportunity_score"], reverse=True)
+        # Sort by opportunity score (partial selection when only the top K are wanted)
+        by_score = attrgetter("opportunity_score")
+        if top_k is not None:
+            ranked = heapq.nlargest(top_k, analyzed_products, key=by_score)
+        else:
+            ranked = sorted(analyzed_products, key=by_score, reverse=True)
+
+        return [asdict(product) for product in ranked]
+
+    async def _analyze_one(self, product_name: str, sem: asyncio.BoundedSemaphore) -> ProductResult:
+        """
+        Run the Trends, Amazon, Shopify and Reddit lookups for one product.
 
-        return analyzed_products
+        Each lookup runs in a worker thread under its own domain semaphore;
+        the product semaphore bounds how many products are in flight at once.
+        """
+        async with sem:
+            # The four lookups hit different hosts, so run them side by side
+            trend_data, amazon_data, shopify_data, reddit_data = await asyncio.gather(
+                asyncio.to_thread(self._run_limited, self._trends_sem, self.trends.check_trend, product_name),
+                asyncio.to_thread(self._run_limited, self._amazon_sem, check_amazon_competition, product_name),
+                asyncio.to_thread(self._run_limited, self._shopify_sem, self.shopify.check_competition, product_name),
+                asyncio.to_thread(self._run_limited, self._reddit_sem, self._get_reddit_sentiment, product_name),
+            )
+
+            data = {**amazon_data, **shopify_data, **reddit_data}
+            result = ProductResult(
+                name=product_name,
+                trend_score=trend_data.get("trend_score", 50),
+                trend_direction=trend_data.get("trend_direction", "unknown"),
+                recent_interest=trend_data.get("recent_interest", 0),
+                **{k: v for k, v in data.items() if k in _RESULT_FIELDS}
+            )
+
+            return result
+
+    @staticmethod
+    def _run_limited(sem: threading.Semaphore, func, *args):
+        """Call func while holding a per-domain semaphore."""
+        with sem:
+            return func(*args)
 
     def _discover_rising_products(self, seed_keywords: List[str], max_products: int) -> List[str]:
         """
@@ -133,40 +241,36 @@ class NicheFinder:
         Returns:
             List of product names
         """
-        all_rising = []
-        seen = set()
+        # Ordered dedup: casefolded query -> query as returned by Trends
+        rising = {}
 
         for keyword in seed_keywords:
-            print(f"  Exploring '{keyword}'...", end=" ")
+            # pytrends keeps request state on the client, so seeds go out one
+            # at a time on the shared client
+            related = self._run_limited(self._trends_sem, self.trends.get_related_queries, keyword)
 
-            related = self.trends.get_related_queries(keyword)
+            rising_count = len(related.get("rising", []))
+            if rising_count:
+                print(f"  Explored '{keyword}': found {rising_count} rising queries")
+            else:
+                print(f"  Explored '{keyword}': no rising data")
 
             # Get rising queries (products gaining momentum)
-            rising_queries = related.get("rising", [])
+            for item in related.get("rising", []):
+                query = item.get("query", "")
+                folded = query.casefold()
 
-            if rising_queries:
-                # Filter for product-like queries (not just informational)
-                for item in rising_queries:
-                    query = item.get("query", "")
+                # Skip if already seen, or informational
+                if folded in rising or not self._is_product_query(query):
+                    continue
 
-                    # Skip if already seen
-                    if query.lower() in seen:
-                        continue
+                rising[folded] = query
 
-                    # Skip informational queries
-                    if self._is_product_query(query):
-                        all_rising.append(query)
-                        seen.add(query.lower())
-
-                print(f"found {len(rising_queries)} rising queries")
-            else:
-                print("no rising data")
+                # Stop as soon as we have enough (no further seeds are queried)
+                if len(rising) >= max_products:
+                    return list(rising.values())
 
-            # Stop if we have enough
-            if len(all_rising) >= max_products:
-                break
-
-        return all_rising[:max_products]
+        return list(rising.values())
 
     def _is_product_query(self, query: str) -> bool:
         """
@@ -178,131 +282,72 @@ class NicheFinder:
         Returns:
             True if likely a product query
         """
-        query_lower = query.lower()
-
-        # Skip informational queries
-        skip_words = [
-            "how to", "what is", "why", "when", "where",
-            "tutorial", "guide", "tips", "best way",
-            "vs", "versus", "comparison", "review",
-            "near me", "store", "buy online"
-        ]
-
-        for skip in skip_words:
-            if skip in query_lower:
-                return False
-
-        # Must have some length
-        if len(query.split()) > 8:  # Too long, probably not a product
-            return False
-
-        return True
+        # Skip informational queries; too long is probably not a product
+        return _SKIP_RE.search(query.lower()) is None and query.count(' ') <= 7
 
     def _get_reddit_sentiment(self, product_name: str) -> Dict[str, Any]:
         """Get Reddit sentiment for a product."""
-        # Search Reddit
-        posts = self.reddit.search_all_reddit(product_name, limit=20)
-
-        if not posts:
-            return {
-                "reddit_posts": 0,
-                "reddit_sentiment": 0,
-                "reddit_positive": 0,
-                "reddit_negative": 0,
-                "sentiment_ratio": 0.5,
-            }
-
-        # Analyze sentiment
-        sentiments = []
-        for post in posts:
-            text = f"{post.get('title', '')} {post.get('content', '')}"
-            label, score = self.sentiment.get_sentiment_label(text)
-            sentiments.append({
-                "label": label,
-                "score": score,
-                "upvotes": post.get("upvotes", 0),
-            })
-
-        # Weighted sentiment (upvotes matter)
-        total_weight = sum(max(s["upvotes"], 1) for s in sentiments)
-        weighted_sentiment = sum(
-            s["score"] * max(s["upvotes"], 1) for s in sentiments
-        ) / total_weight if total_weight > 0 else 0
-
-        positive_count = sum(1 for s in sentiments if s["label"] == "positive")
-        negative_count = sum(1 for s in sentiments if s["label"] == "negative")
-
-        return {
-            "reddit_posts": len(posts),
-            "reddit_sentiment": round(weighted_sentiment, 3),
-            "reddit_positive": positive_count,
-            "reddit_negative": negative_count,
-            "sentiment_ratio": round(
-                positive_count / max(positive_count + negative_count, 1), 2
-            ),
-        }
-
-    def _calculate_opportunity_score(self, product: Dict[str, Any]) -> float:
+        return analyze_reddit_sentiment(
+            self.reddit, self.sentiment, product_name,
+            limit=20, cache=self._reddit_cache
+        )
+
+    @staticmethod
+    def _score_products(products: List[ProductResult]) -> None:
         """
-        Calculate opportunity score (0-100).
+        Calculate opportunity scores (0-100) for all products in one pass.
 
         Factors:
         - Rising trend (25 pts)
         - Low Amazon competition (25 pts)
         - Low Shopify competition (25 pts)
         - Positive sentiment (25 pts)
+
+        Sets opportunity_score on each product in place.
         """
+        if not products:
+            return
+
+        def column(attr: str) -> np.ndarray:
+            return np.fromiter((getattr(p, attr) for p in products), dtype=np.float64, count=len(products))
+
+        def flag(attr: str, value: str) -> np.ndarray:
+            return np.fromiter((getattr(p, attr) == value for p in products), dtype=bool, count=len(products))
 
         # 1. Trend component (0-25 pts)
-        # Rising = higher score
-        trend_score = product.get("trend_score", 50)
-        if product.get("trend_direction") == "rising":
-            trend_component = (trend_score / 100) * 25
-        else:
-            trend_component = (trend_score / 100) * 15  # Penalize non-rising
+        # Rising = higher score, non-rising is penalized
+        trend = column("trend_score") / 100
+        trend_component = np.where(flag("trend_direction", "rising"), trend * 25, trend * 15)
 
         # 2. Amazon competition (0-25 pts)
         # Lower competition = higher score
-        amazon_score = product.get("amazon_score", 50)
-        amazon_component = (amazon_score / 100) * 25
+        amazon_component = column("amazon_score") / 100 * 25
 
         # 3. Shopify competition (0-25 pts)
         # Fewer stores = higher score
-        shopify_score = product.get("shopify_score", 50)
-        shopify_component = (shopify_score / 100) * 25
+        shopify_component = column("shopify_score") / 100 * 25
 
         # 4. Reddit sentiment (0-25 pts)
-        sentiment = product.get("reddit_sentiment", 0)
-        posts = product.get("reddit_posts", 0)
-
-        # Convert sentiment -1 to 1 → 0 to 25
-        sentiment_component = ((sentiment + 1) / 2) * 20
-
-        # Bonus for discussion volume
-        volume_bonus = min(5, math.log10(posts + 1) * 2.5)
+        # Convert sentiment -1 to 1 → 0 to 20, plus a bonus for discussion volume
+        sentiment_component = (column("reddit_sentiment") + 1) / 2 * 20
+        volume_bonus = np.minimum(5, np.log10(column("reddit_posts") + 1) * 2.5)
 
-        sentiment_total = sentiment_component + volume_bonus
-
-        # Final score
-        final_score = (
+        final_scores = (
             trend_component +
             amazon_component +
             shopify_component +
-            sentiment_total
+            sentiment_component +
+            volume_bonus
         )
 
         # Bonuses
-        if product.get("sentiment_ratio", 0) > 0.7:
-            final_score += 5  # Strong positive ratio
+        final_scores += np.where(column("sentiment_ratio") > 0.7, 5, 0)  # Strong positive ratio
 
         # Penalties
-        if product.get("reddit_negative", 0) > product.get("reddit_positive", 0):
-            final_score -= 10  # More negative than positive
-
-        if product.get("amazon_saturation") == "very_high":
-            final_score -= 5  # Very saturated on Amazon
-
-        if product.get("shopify_saturation") == "very_high":
-            final_score -= 5  # Very saturated on Shopify
+        final_scores -= np.where(column("reddit_negative") > column("reddit_positive"), 10, 0)
+        final_scores -= np.where(flag("amazon_saturation", "very_high"), 5, 0)
+        final_scores -= np.where(flag("shopify_saturation", "very_high"), 5, 0)
 
-        return round(min(100, max(0, final_score)), 1)
+        final_scores = np.round(np.clip(final_scores, 0, 100), 1)
+        for product, score in zip(products, final_scores.tolist()):
+            product.opportunity_score = score
@@ -0,0 +1,96 @@
+"""
+Shared Reddit sentiment helpers used by all discovery finders.
+
+Keeps search → batched sentiment → weighted aggregation in one place so the
+finders only decide what to search for.
+"""
+
+from typing import Dict, Any, Optional, Sequence, Tuple
+from analysis import aggregate_sentiment
+
+
+def empty_reddit_sentiment() -> Dict[str, Any]:
+    """Result used when no (relevant) Reddit posts were found."""
+    return {
+        "reddit_posts": 0,
+        "reddit_sentiment": 0,
+        "reddit_positive": 0,
+        "reddit_negative": 0,
+        "sentiment_ratio": 0.5,
+    }
+
+
+def summarize_sentiment(
+    labeled: Sequence[Tuple[str, float]],
+    weights: Sequence[float],
+    post_count: int
+) -> Dict[str, Any]:
+    """
+    Build the reddit_* result fields from labeled texts.
+
+    Args:
+        labeled: (label, score) tuples from get_sentiment_labels_batch
+        weights: Per-text weights (e.g. upvotes)
+        post_count: Number of posts the texts came from
+
+    Returns:
+        Dict with reddit_posts, reddit_sentiment, reddit_positive,
+        reddit_negative and sentiment_ratio
+    """
+    weighted_sentiment, positive_count, negative_count = aggregate_sentiment(labeled, weights)
+
+    return {
+        "reddit_posts": post_count,
+        "reddit_sentiment": round(weighted_sentiment, 3),
+        "reddit_positive": positive_count,
+        "reddit_negative": negative_count,
+        "sentiment_ratio": round(
+            positive_count / max(positive_count + negative_count, 1), 2
+        ),
+    }
+
+
+def analyze_reddit_sentiment(
+    reddit_scraper,
+    sentiment_analyzer,
+    query: str,
+    *,
+    limit: int = 20,
+    fallback_query: Optional[str] = None,
+    cache: Optional[Dict[tuple, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Search Reddit and score the posts' sentiment, weighted by upvotes.
+
+    Args:
+        reddit_scraper: RedditScraper used for the search
+        sentiment_analyzer: SentimentAnalyzer used for scoring
+        query: Search query
+        limit: Max posts to fetch
+        fallback_query: Query to try if the first returns no posts
+        cache: Optional dict to memoize results across calls
+
+    Returns:
+        Reddit sentiment metrics (see summarize_sentiment)
+    """
+    key = (query.lower(), fallback_query.lower() if fallback_query else None, limit)
+    if cache is not None and key in cache:
+        return dict(cache[key])
+
+    posts = reddit_scraper.search_all_reddit(query, limit=limit)
+    if not posts and fallback_query:
+        posts = reddit_scraper.search_all_reddit(fallback_query, limit=limit)
+
+    # Not cached: an empty result may be a transient search failure
+    if not posts:
+        return empty_reddit_sentiment()
+
+    # One batch call for all posts
+    texts = [f"{post.get('title', '')} {post.get('content', '')}" for post in posts]
+    labeled = sentiment_analyzer.get_sentiment_labels_batch(texts)
+    weights = [max(post.get("upvotes", 0), 1) for post in posts]
+    result = summarize_sentiment(labeled, weights, len(posts))
+
+    if cache is not None:
+        cache[key] = result
+    return dict(result)
@@ -4,11 +4,23 @@ No browser automation - uses HTTP requests and search URLs
 """
 
 import re
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 from scrapers.trends_discovery import TrendsDiscovery
-from scrapers import RedditScraper
-from analysis import SentimentAnalyzer
+from scrapers import RedditScraper, create_http_session
+from analysis import SentimentAnalyzer, log_volume
+from .reddit_sentiment import analyze_reddit_sentiment
+
+_WORD_RE = re.compile(r'\w+')
+
+# Common words ignored when extracting search keywords
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for',
+    'from', 'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on',
+    'that', 'the', 'to', 'was', 'will', 'with'
+})
 
 
 class SimpleNicheFinder:
@@ -24,14 +36,21 @@ class SimpleNicheFinder:
 
     def __init__(self):
         self.trends = TrendsDiscovery(delay=2.0)
-        self.reddit = RedditScraper(delay=2.0)
+        self.reddit = RedditScraper(delay=2.0, session=create_http_session())
         self.sentiment = SentimentAnalyzer()
 
+        # Reddit is the only host hit per product; cap in-flight searches
+        self._reddit_sem = threading.Semaphore(3)
+
+        # Reddit sentiment results keyed by query
+        self._reddit_cache: Dict[tuple, Dict[str, Any]] = {}
+
     def discover_niches(
         self,
         seed_keywords: List[str],
         max_products: int = 30,
-        progress_callback=None
+        progress_callback=None,
+        max_workers: int = 4
     ) -> List[Dict[str, Any]]:
         """
         Discover product niches.
@@ -40,6 +59,7 @@ class SimpleNicheFinder:
             seed_keywords: Category keywords to explore
             max_products: Max products to analyze
             progress_callback: Progress update function
+            max_workers: Products analyzed in parallel
 
         Returns:
             List of opportunities with scores
@@ -67,55 +87,62 @@ class SimpleNicheFinder:
         print("\n[STEP 2] Analyzing products...")
         print("-" * 50)
 
+        to_analyze = trending_products[:max_products]
         results = []
 
-        for i, product_name in enumerate(trending_products[:max_products]):
-            if progress_callback:
-                progress_callback(i, len(trending_products[:max_products]), product_name)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._analyze_product, name) for name in to_analyze]
 
-            print(f"\n  [{i+1}/{min(len(trending_products), max_products)}] {product_name}")
+            for i, future in enumerate(as_completed(futures)):
+                result = future.result()
 
-            result = {
-                "name": product_name,
-                "source": "google_trends"
-            }
+                if progress_callback:
+                    progress_callback(i, len(to_analyze), result["name"])
 
-            # Generate marketplace URLs
-            result["amazon_url"] = self._get_amazon_search_url(product_name)
-            result["shopify_search_url"] = self._get_shopify_search_url(product_name)
+                print(f"\n  [{i+1}/{len(to_analyze)}] {result['name']}")
+                print(f"    Keywords: {', '.join(result['keywords'])}")
+                if result["reddit_posts"] > 0:
+                    sent = result["reddit_sentiment"]
+                    label = "positive" if sent > 0.05 else "negative" if sent < -0.05 else "neutral"
+                    print(f"    Reddit: {result['reddit_posts']} posts, {label} ({sent:.2f})")
+                else:
+                    print("    Reddit: no posts")
+                print(f"    Opportunity Score: {result['opportunity_score']:.1f}/100")
 
-            # Extract keywords for Reddit search
-            keywords = self._extract_keywords(product_name)
-            result["keywords"] = keywords
+                results.append(result)
 
-            print(f"    Keywords: {', '.join(keywords)}")
+        # Sort by score
+        results.sort(key=lambda x: x["opportunity_score"], reverse=True)
+
+        return results
 
-            # Reddit sentiment using keywords
-            print(f"    Searching Reddit...", end=" ")
-            reddit_data = self._get_reddit_sentiment(keywords)
-            result.update(reddit_data)
+    def _analyze_product(self, product_name: str) -> Dict[str, Any]:
+        """Build the scored result for one trending product (runs in a worker thread)."""
+        result = {
+            "name": product_name,
+            "source": "google_trends"
+        }
 
-            if reddit_data["reddit_posts"] > 0:
-                sent = reddit_data["reddit_sentiment"]
-                label = "positive" if sent > 0.05 else "negative" if sent < -0.05 else "neutral"
-                print(f"{reddit_data['reddit_posts']} posts, {label} ({sent:.2f})")
-            else:
-                print("no posts")
+        # Generate marketplace URLs
+        result["amazon_url"] = self._get_amazon_search_url(product_name)
+        result["shopify_search_url"] = self._get_shopify_search_url(product_name)
 
-            # Simple trend score (it's trending if it showed up)
-            result["trend_score"] = 75
-            result["trend_direction"] = "rising"
+        # Extract keywords for Reddit search
+        keywords = self._extract_keywords(product_name)
+        result["keywords"] = keywords
 
-            # Calculate opportunity score
-            result["opportunity_score"] = self._calculate_opportunity_score(result)
-            print(f"    Opportunity Score: {result['opportunity_score']:.1f}/100")
+        # Reddit sentiment using keywords
+        with self._reddit_sem:
+            result.update(self._get_reddit_sentiment(keywords))
 
-            results.append(result)
+        # Simple trend score (it's trending if it showed up)
+        result["trend_score"] = 75
+        result["trend_direction"] = "rising"
 
-        # Sort by score
-        results.sort(key=lambda x: x["opportunity_score"], reverse=True)
+        # Calculate opportunity score
+        result["opportunity_score"] = self._calculate_opportunity_score(result)
 
-        return results
+        return result
 
     def _get_amazon_search_url(self, product_name: str) -> str:
         """Generate Amazon search URL."""
@@ -136,20 +163,17 @@ class SimpleNicheFinder:
         # Clean the product name
         clean_name = product_name.lower()
 
-        # Remove common words
-        stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for',
-            'from', 'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on',
-            'that', 'the', 'to', 'was', 'will', 'with'
-        }
+        # Nothing long enough to be a keyword
+        if len(clean_name) < 3:
+            return []
 
         # Split into words
-        words = re.findall(r'\w+', clean_name)
+        words = _WORD_RE.findall(clean_name)
 
         # Filter out stop words and short words
         keywords = [
             word for word in words
-            if word not in stop_words and len(word) > 2
+            if word not in _STOP_WORDS and len(word) > 2
         ]
 
         # Return top 3 most meaningful keywords
@@ -165,50 +189,10 @@ class SimpleNicheFinder:
         Returns:
             Dict with Reddit metrics
         """
-        # Create search query from keywords
-        query = ' '.join(keywords)
-
-        # Search Reddit
-        posts = self.reddit.search_all_reddit(query, limit=20)
-
-        if not posts:
-            return {
-                "reddit_posts": 0,
-                "reddit_sentiment": 0,
-                "reddit_positive": 0,
-                "reddit_negative": 0,
-                "sentiment_ratio": 0.5,
-            }
-
-        # Analyze sentiment
-        sentiments = []
-        for post in posts:
-            text = f"{post.get('title', '')} {post.get('content', '')}"
-            label, score = self.sentiment.get_sentiment_label(text)
-            sentiments.append({
-                "label": label,
-                "score": score,
-                "upvotes": post.get("upvotes", 0),
-            })
-
-        # Weighted sentiment
-        total_weight = sum(max(s["upvotes"], 1) for s in sentiments)
-        weighted_sentiment = sum(
-            s["score"] * max(s["upvotes"], 1) for s in sentiments
-        ) / total_weight if total_weight > 0 else 0
-
-        positive_count = sum(1 for s in sentiments if s["label"] == "positive")
-        negative_count = sum(1 for s in sentiments if s["label"] == "negative")
-
-        return {
-            "reddit_posts": len(posts),
-            "reddit_sentiment": round(weighted_sentiment, 3),
-            "reddit_positive": positive_count,
-            "reddit_negative": negative_count,
-            "sentiment_ratio": round(
-                positive_count / max(positive_count + negative_count, 1), 2
-            ),
-        }
+        return analyze_reddit_sentiment(
+            self.reddit, self.sentiment, ' '.join(keywords),
+            limit=20, cache=self._reddit_cache
+        )
 
     def _calculate_opportunity_score(self, product: Dict[str, Any]) -> float:
         """
@@ -229,8 +213,7 @@ class SimpleNicheFinder:
         sentiment_component = ((sentiment + 1) / 2) * 40
 
         # Discussion volume bonus (0-10 pts)
-        import math
-        volume_bonus = min(10, math.log10(posts + 1) * 5)
+        volume_bonus = min(10, log_volume(posts) * 5)
 
         final_score = base_score + sentiment_component + volume_bonus
 
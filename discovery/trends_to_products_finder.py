@@ -12,21 +12,138 @@ ASYNC VERSION: Parallel Reddit sentiment for 3-4x speedup.
 
 import re
 import asyncio
+import atexit
+import heapq
 import sys
-from datetime import datetime
-from typing import List, Dict, Any, Callable, Optional
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from statistics import fmean
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from urllib.parse import quote, urlencode
+import numpy as np
 from scrapers.trends_rising_simple import TrendsRisingSimple
-from scrapers.browser_scraper import BrowserScraper
-from scrapers import RedditScraper
-from analysis import SentimentAnalyzer
+from scrapers.browser_scraper import BrowserScraper, parse_price
+from scrapers import RedditScraper, create_http_session
+from analysis import SentimentAnalyzer, log_volume
 from database import Database
+from .reddit_sentiment import empty_reddit_sentiment, summarize_sentiment
 
 # Async components for parallel processing
-from scrapers.async_worker_pool import AsyncWorkerPool
 from scrapers.async_reddit_scraper import AsyncRedditScraper
 from scrapers.async_browser_scraper import AsyncBrowserScraper
 
 
+# Sizes/quantities, parenthesized and bracketed text stripped from product names
+_STRIP_RE = re.compile(
+    r'\d+\s*(?:oz|ml|inch|pack|count|lb|kg|piece|set|mm|cm|ft)\b|\([^)]*\)|\[[^\]]*\]',
+    re.IGNORECASE
+)
+_WORD_RE = re.compile(r'\w+')
+_NON_WORD_RE = re.compile(r'\W+')
+
+# Words ignored when extracting search keywords from product names
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for',
+    'from', 'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on',
+    'that', 'the', 'to', 'was', 'will', 'with', 'pack', 'set',
+    'new', 'best', 'top', 'premium', 'professional'
+})
+
+# Seasonal keyword patterns, in priority order; "holiday" is the generic fallback
+SEASONAL_PATTERNS = {
+    "christmas": ["christmas", "xmas", "santa", "reindeer", "snowman", "ornament", "stocking"],
+    "halloween": ["halloween", "costume", "spooky", "pumpkin", "witch", "ghost", "skeleton"],
+    "valentines": ["valentine", "heart shaped", "romantic", "cupid"],
+    "easter": ["easter", "bunny", "egg hunt"],
+    "thanksgiving": ["thanksgiving", "turkey", "pilgrim"],
+    "summer": ["beach", "pool float", "sunscreen", "swimsuit", "bikini", "surfboard", "patio"],
+    "winter": ["snow blower", "ice scraper", "heated blanket", "space heater", "snow shovel"],
+    "back_to_school": ["backpack", "school supplies", "lunchbox", "pencil case", "binder"],
+    "new_years": ["new year", "party supplies", "champagne", "countdown"],
+    "mothers_day": ["mothers day", "mom gift"],
+    "fathers_day": ["fathers day", "dad gift"],
+    "black_friday": ["black friday", "cyber monday"],
+    "holiday": ["holiday", "festive", "celebration", "party"],
+}
+
+# One anchored lookahead branch per season (same trick as NICHE_RE), so the
+# first season in priority order with any keyword in the name wins
+SEASON_RE = re.compile(
+    '|'.join(
+        f"(?P<{season}>(?=.*(?:{'|'.join(map(re.escape, words))})))"
+        for season, words in SEASONAL_PATTERNS.items()
+    ),
+    re.IGNORECASE | re.DOTALL
+)
+
+# Competition tiers by Amazon review count: a count below threshold i falls in
+# tier i (the last tier has no upper bound). Low score = great opportunity,
+# high score = saturated market.
+COMPETITION_REVIEW_THRESHOLDS = (100, 500, 1000, 2500, 5000, 10000)
+COMPETITION_LEVELS = ("Very Low", "Low", "Low-Medium", "Medium", "Medium-High", "High", "Very High")
+COMPETITION_SCORES = (10, 25, 40, 55, 70, 85, 95)
+
+# Market entry difficulty by competition score, same tiering
+ENTRY_DIFFICULTY_THRESHOLDS = (30, 50, 70)
+ENTRY_DIFFICULTIES = ("Easy", "Moderate", "Challenging", "Difficult")
+
+# Below this many products, scoring one dict at a time beats building arrays
+BATCH_SCORE_MIN_PRODUCTS = 50
+
+# Opportunity score points, same tiering: fewer reviews = less saturated
+# (no reviews counts as unknown competition, i.e. an opportunity)
+OPPORTUNITY_REVIEW_THRESHOLDS = (50, 200, 1000, 5000)
+OPPORTUNITY_REVIEW_SCORES = (25, 20, 15, 10, 5)
+# Validation bonus by Amazon rating (rating >= threshold i earns bonus i + 1)
+OPPORTUNITY_RATING_THRESHOLDS = (3.5, 4.0, 4.5)
+OPPORTUNITY_RATING_BONUSES = (0, 1, 2, 3)
+# Accessories and alternatives often have better margins
+NICHE_BONUSES = {"accessory": 10, "alternative": 8, "complementary": 6}
+
+# Common product types looked for in product names
+_PRODUCT_TYPES = (
+    "blender", "massager", "posture corrector", "back brace",
+    "air fryer", "watch", "earbuds", "headphones", "speaker",
+    "vacuum", "charger", "case", "stand", "mat", "band",
+    "tracker", "scale", "monitor", "lamp", "fan", "heater",
+    "humidifier", "purifier", "cooker", "grill", "toaster",
+    "mixer", "juicer", "processor", "maker", "kettle",
+)
+
+# First product type in the name; longest alternatives first so multi-word
+# types beat their prefixes. Leading word boundary only, so plurals still match
+# ("chargers") but "stand" doesn't match inside "understand".
+_PTYPE_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(_PRODUCT_TYPES, key=len, reverse=True))) + r')',
+    re.IGNORECASE
+)
+
+# Brand names and filler words removed from product names before supplier searches
+_BRANDS = (
+    "amazon", "ninja", "cuisinart", "instant", "keurig", "dyson",
+    "shark", "bissell", "hoover", "breville", "kitchenaid", "hamilton",
+    "black+decker", "oster", "sunbeam", "fit geno", "upright go",
+)
+_FILLERS = (
+    "premium", "deluxe", "professional", "advanced", "ultimate",
+    "best", "top", "rated", "new", "upgraded", "improved", "2024", "2025",
+    "for women", "for men", "for women and men", "unisex",
+)
+_BRAND_FILLER_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _BRANDS + _FILLERS)) + r')\b'
+)
+_LOWER_WORD_RE = re.compile(r'\b[a-z]+\b')
+
+# Worker threads fetching a product's Reddit comment threads. Requests from
+# all workers (and all products being analyzed) still go out one interval
+# apart through RedditScraper's shared per-host rate limit.
+COMMENT_FETCH_WORKERS = 5
+
+
 # Niche discovery patterns - what to search for each trending topic
 NICHE_PATTERNS = {
     "accessories": [
@@ -83,6 +200,91 @@ CATEGORY_NICHES = {
     },
 }
 
+# Niche type of a search keyword, by substring. Each branch is a lookahead
+# anchored at the start, so branches are tried in priority order (accessory
+# words win over alternative words, and so on) in a single scan.
+NICHE_RE = re.compile(
+    r'(?P<accessory>(?=.*(?:case|cover|charger|stand|holder|strap|band|mount|bag|screen protector)))'
+    r'|(?P<alternative>(?=.*(?:alternative|budget|cheap|dupe|like|similar)))'
+    r'|(?P<complementary>(?=.*(?:bundle|kit|set|starter|compatible|combo)))',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Pre-sliced keyword templates per (category, niche type): the first 2 generic
+# patterns followed by the first 2 category-specific suffixes, duplicates dropped
+PATTERN_CACHE = {
+    (category, niche_type): tuple(dict.fromkeys([
+        *patterns[:2],
+        *(f"{{topic}} {suffix}" for suffix in CATEGORY_NICHES.get(category, {}).get(niche_type, [])[:2]),
+    ]))
+    for category in (*CATEGORY_NICHES, "general")
+    for niche_type, patterns in NICHE_PATTERNS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _name_keywords(product_name: str) -> Tuple[str, ...]:
+    """Top 3 meaningful keywords of a product name (cached per name)."""
+    # Remove sizes, parentheses and brackets in a single pass
+    clean_name = _STRIP_RE.sub('', product_name.lower())
+
+    # Nothing long enough to be a keyword
+    if len(clean_name) < 3:
+        return ()
+
+    # Split and filter
+    words = _WORD_RE.findall(clean_name)
+    keywords = [
+        word for word in words
+        if word not in _STOP_WORDS and len(word) > 2
+    ]
+
+    # Return top 3 most meaningful
+    return tuple(keywords[:3])
+
+
+@lru_cache(maxsize=2048)
+def _shopify_url(product_name: str) -> str:
+    """Google search URL for Shopify stores selling a product (cached per name)."""
+    return "https://www.google.com/search?" + urlencode({"q": f'site:myshopify.com "{product_name}"'})
+
+
+@lru_cache(maxsize=2048)
+def _sourcing_urls(search_terms: str) -> Tuple[str, str, str]:
+    """Alibaba, AliExpress and Made-in-China search URLs for sourcing terms (cached)."""
+    params = urlencode({"SearchText": search_terms})
+    return (
+        f"https://www.alibaba.com/trade/search?{params}",
+        f"https://www.aliexpress.com/wholesale?{params}",
+        f"https://www.made-in-china.com/products-search/hot-china-products/{quote(search_terms)}.html",
+    )
+
+
+# One event loop per calling thread, kept alive across discover_opportunities_fast
+# calls (asyncio.Runner is not thread-safe; the Streamlit app calls from several)
+_runners = threading.local()
+_all_runners: List[asyncio.Runner] = []
+_runners_lock = threading.Lock()
+
+
+def _get_runner() -> asyncio.Runner:
+    """Return this thread's long-lived asyncio.Runner, creating it on first use."""
+    runner = getattr(_runners, "runner", None)
+    if runner is None:
+        runner = _runners.runner = asyncio.Runner()
+        with _runners_lock:
+            _all_runners.append(runner)
+    return runner
+
+
+@atexit.register
+def _close_runners() -> None:
+    """Close every runner's event loop at interpreter exit."""
+    with _runners_lock:
+        for runner in _all_runners:
+            runner.close()
+        _all_runners.clear()
+
 
 class TrendsToProductsFinder:
     """
@@ -95,18 +297,36 @@ class TrendsToProductsFinder:
     4. Score and rank based on competition + sentiment
     """
 
-    def __init__(self):
+    def __init__(self, db: Optional[Database] = None, verbose: bool = True):
+        """
+        Args:
+            db: Shared Database (reuses its connection pool); created if not given
+            verbose: Print per-product progress (UI callers get progress_callback instead)
+        """
+        self.verbose = verbose
+
         # Use rate-limited trends scraper (25s delay between requests)
         self.trends = TrendsRisingSimple(delay=25.0)
 
         # Use Playwright-based Amazon scraper (bypasses bot detection)
         self.amazon = BrowserScraper(delay=30.0)
 
-        # Reddit scraper
-        self.reddit = RedditScraper(delay=2.0)
+        # Reddit scraper (pooled keep-alive connections)
+        self.reddit = RedditScraper(delay=2.0, session=create_http_session())
 
         self.sentiment = SentimentAnalyzer()
-        self.db = Database()
+        self.db = db or Database()
+
+        # Per-run memos: Reddit sentiment keyed by the search inputs (shared by
+        # near-duplicate names) and Amazon review sentiment keyed by (ASIN, max_reviews).
+        # Values are Futures so concurrent analyses of the same key share one fetch.
+        self._reddit_sentiment_cache: Dict[tuple, Future] = {}
+        self._amazon_review_cache: Dict[tuple, Future] = {}
+        self._cache_lock = threading.Lock()
+
+        # self.amazon keeps its browser/page on the instance, so review scrapes
+        # from concurrent product analyses must take turns
+        self._amazon_reviews_lock = threading.Lock()
 
     def _save_to_history(
         self,
@@ -114,7 +334,7 @@ class TrendsToProductsFinder:
         mode: str,
         categories: List[str],
         settings: dict,
-        start_time: datetime
+        start_time: float
     ) -> int:
         """
         Save discovery results to database for historical tracking.
@@ -124,14 +344,14 @@ class TrendsToProductsFinder:
             mode: Discovery mode (discover, custom_keywords, etc.)
             categories: Categories used for discovery
             settings: Settings dict (max_products, niche_types, etc.)
-            start_time: When the discovery started
+            start_time: time.monotonic() when the discovery started
 
         Returns:
             Run ID of the saved discovery run
         """
         try:
-            duration = int((datetime.utcnow() - start_time).total_seconds())
-            avg_score = sum(r.get('opportunity_score', 0) for r in results) / len(results) if results else 0
+            duration = int(time.monotonic() - start_time)
+            avg_score = fmean(r.get('opportunity_score', 0) for r in results) if results else 0
 
             # Create discovery run
             run = self.db.create_discovery_run(
@@ -151,6 +371,9 @@ class TrendsToProductsFinder:
                 duration_seconds=duration
             )
 
+            # Rebuild precomputed aggregates so dashboards read single rows
+            self.db.refresh_product_metrics()
+
             print(f"\n[HISTORY] Saved run #{run.id} with {saved_count} products to database")
             return run.id
 
@@ -166,7 +389,9 @@ class TrendsToProductsFinder:
         niche_types: List[str] = None,
         include_amazon_sentiment: bool = True,
         min_price: float = 0.0,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        top_k: Optional[int] = None,
+        analysis_workers: int = 4
     ) -> List[Dict[str, Any]]:
         """
         Discover product opportunities from trending topics.
@@ -179,20 +404,18 @@ class TrendsToProductsFinder:
             include_amazon_sentiment: Whether to scrape Amazon reviews for sentiment
             min_price: Minimum price filter (default 0 = no filter)
             progress_callback: Callback function(step, total_steps, current_item, message)
+            top_k: Only return the K best opportunities (all are still saved to history)
+            analysis_workers: Products whose sentiment is analyzed at the same time
 
         Returns:
-            List of product opportunities with sentiment data
+            List of product opportunities with sentiment data, best first
         """
         if niche_types is None:
             niche_types = ["accessories", "alternatives", "complementary"]
 
         # Track start time for history
-        start_time = datetime.utcnow()
-
-        def update_progress(step: int, total: int, item: str = "", message: str = ""):
-            if progress_callback:
-                progress_callback(step, total, item, message)
-            print(f"  [{step}/{total}] {message} {item[:50] if item else ''}")
+        start_time = time.monotonic()
+        self._reset_run_caches()
 
         print("\n" + "=" * 70)
         print("TRENDS TO PRODUCTS DISCOVERY (Enhanced)")
@@ -216,23 +439,34 @@ class TrendsToProductsFinder:
         for topic in rising_topics[:5]:
             print(f"  - {topic['title']} ({topic.get('category', 'general')})")
 
-        # STEP 2: Generate niche search keywords
+        # STEP 2: Generate niche search keywords (grouped by category so each
+        # category can be searched independently)
         print("\n[STEP 2] Generating niche product searches...")
         print("-" * 50)
 
         if progress_callback:
             progress_callback(2, 4, "", "Generating niche keywords...")
 
-        search_keywords = self._generate_niche_keywords(
-            rising_topics[:8],  # Top 8 topics to limit API calls
-            niche_types=niche_types,
-            max_keywords_per_topic=4
-        )
+        topics_by_category = {}
+        for topic in rising_topics[:8]:  # Top 8 topics to limit API calls
+            topics_by_category.setdefault(topic.get('category', 'general'), []).append(topic)
+
+        keyword_groups = {
+            category: self._generate_niche_keywords(
+                topics,
+                niche_types=niche_types,
+                max_keywords_per_topic=4
+            )
+            for category, topics in topics_by_category.items()
+        }
 
-        print(f"  Generated {len(search_keywords)} search queries across {len(niche_types)} niche types")
+        total_keywords = sum(len(kws) for kws in keyword_groups.values())
+        print(f"  Generated {total_keywords} search queries across {len(niche_types)} niche types "
+              f"in {len(keyword_groups)} categories")
 
-        # STEP 3: Find products on Amazon
-        print("\n[STEP 3] Searching Amazon for niche products...")
+        # STEP 3 + 4: Search Amazon one category at a time and analyze
+        # sentiment as each category's products arrive
+        print("\n[STEP 3] Searching Amazon for niche products (by category)...")
         if min_price > 0:
             print(f"  (filtering for products >= ${min_price:.0f})")
         print("-" * 50)
@@ -240,119 +474,264 @@ class TrendsToProductsFinder:
         if progress_callback:
             progress_callback(3, 4, "", "Searching Amazon...")
 
-        products = self.amazon.search_products_batch(
-            keywords=search_keywords,
-            products_per_keyword=products_per_topic,
-            min_price=min_price,
-            progress_callback=lambda i, t, k: update_progress(i, t, k, "Searching:")
-        )
+        # Products are handed to the analysis pool as soon as their category's
+        # search returns, so sentiment lookups overlap the remaining searches
+        pending = []
+        seen_asins = set()
+        seen_names = set()  # Same listing under different ASINs/variants
+        # Searches run one after another on a single worker so only the
+        # Reddit analysis overlaps them
+        executor = ThreadPoolExecutor(max_workers=1)
+        analysis_executor = ThreadPoolExecutor(max_workers=analysis_workers)
+
+        # One warm browser (one rate limiter and circuit breaker) serves every
+        # Amazon search and review scrape of this run
+        self.amazon.open_session()
+        try:
+            futures = {
+                executor.submit(
+                    self._search_category_products,
+                    category, keywords, products_per_topic, min_price
+                ): category
+                for category, keywords in keyword_groups.items()
+            }
 
-        if not products:
+            for future in as_completed(futures):
+                category = futures[future]
+                products = future.result()
+                print(f"\n  [{category}] Found {len(products)} products on Amazon")
+
+                for product in products:
+                    if len(pending) >= max_products:
+                        break
+                    name_key = _NON_WORD_RE.sub(' ', product['name'].lower()).strip()
+                    if product['asin'] in seen_asins or name_key in seen_names:
+                        continue
+                    seen_asins.add(product['asin'])
+                    seen_names.add(name_key)
+
+                    if progress_callback:
+                        progress_callback(len(pending) + 1, max_products, product['name'][:40], "Analyzing:")
+
+                    if self.verbose:
+                        print(f"\n  [{len(pending)+1}/{max_products}] {product['name'][:60]}")
+                    pending.append(
+                        analysis_executor.submit(self._analyze_product, product, include_amazon_sentiment)
+                    )
+
+                if len(pending) >= max_products:
+                    break
+
+            # Drop the categories we no longer need before they start
+            executor.shutdown(wait=False, cancel_futures=True)
+            results = [f.result() for f in pending]
+        finally:
+            # Let an in-flight search finish before its browser is closed
+            executor.shutdown(wait=True, cancel_futures=True)
+            analysis_executor.shutdown(wait=True, cancel_futures=True)
+            self.amazon.close_session()
+
+        if not results:
             print("  No products found on Amazon")
             return []
 
-        print(f"\nFound {len(products)} unique products on Amazon")
+        print("\n" + "=" * 70)
+        print(f"Discovery complete! Found {len(results)} opportunities")
+        print("=" * 70)
 
-        # STEP 4: Analyze sentiment (Reddit + Amazon reviews)
-        print("\n[STEP 4] Analyzing sentiment (Reddit + Amazon reviews)...")
-        print("-" * 50)
+        # Save to history database
+        self._save_to_history(
+            results=results,
+            mode="discover",
+            categories=categories or [],
+            settings={
+                "max_products": max_products,
+                "niche_types": niche_types,
+                "include_amazon_sentiment": include_amazon_sentiment,
+                "min_price": min_price
+            },
+            start_time=start_time
+        )
 
-        results = []
-        total_products = min(len(products), max_products)
+        # Rank by score (partial selection when only the top K are wanted)
+        if top_k is not None:
+            return heapq.nlargest(top_k, results, key=itemgetter("opportunity_score"))
 
-        for i, product in enumerate(products[:max_products]):
-            if progress_callback:
-                progress_callback(i + 1, total_products, product['name'][:40], "Analyzing:")
+        results.sort(key=itemgetter("opportunity_score"), reverse=True)
+        return results
+
+    def _get_amazon_sentiment(self, asin: str, max_reviews: int = 10) -> Dict[str, Any]:
+        """Scrape and score Amazon reviews (memoized per ASIN for the run)."""
+        return self._single_flight(
+            self._amazon_review_cache, (asin, max_reviews),
+            lambda: self._scrape_amazon_sentiment(asin, max_reviews)
+        )
+
+    def _scrape_amazon_sentiment(self, asin: str, max_reviews: int) -> Dict[str, Any]:
+        """Scrape and score Amazon reviews, one product at a time (uncached)."""
+        with self._amazon_reviews_lock:
+            return self.amazon.get_product_sentiment(asin, self.sentiment, max_reviews=max_reviews)
+
+    def _single_flight(self, cache: Dict[tuple, Future], key: tuple, fetch: Callable) -> Dict[str, Any]:
+        """
+        Return fetch() memoized in cache under key.
 
-            print(f"\n  [{i+1}/{total_products}] {product['name'][:60]}")
+        The first caller for a key runs fetch(); concurrent callers for the same
+        key wait on its Future instead of repeating the request. Failures are
+        not cached.
 
-            # Extract keywords for Reddit search
-            keywords = self._extract_keywords(product['name'])
+        Returns:
+            A copy of the cached result dict
+        """
+        with self._cache_lock:
+            future = cache.get(key)
+            owner = future is None
+            if owner:
+                future = cache[key] = Future()
+
+        if owner:
+            try:
+                future.set_result(fetch())
+            except Exception as e:
+                with self._cache_lock:
+                    cache.pop(key, None)
+                future.set_exception(e)
+
+        return dict(future.result())
+
+    def _reset_run_caches(self) -> None:
+        """Drop per-run Reddit/Amazon memos so each discovery sees fresh data."""
+        with self._cache_lock:
+            self._reddit_sentiment_cache.clear()
+            self._amazon_review_cache.clear()
+
+    @staticmethod
+    def _print_sentiment_summary(
+        reddit_data: Dict[str, Any],
+        amazon_data: Optional[Dict[str, Any]],
+        score: float
+    ) -> None:
+        """
+        Print the per-product Reddit / Amazon review sentiment and score lines.
 
-            # Reddit sentiment
-            print(f"    Reddit...", end=" ")
-            reddit_data = self._get_reddit_sentiment(keywords, product['name'])
+        Written in one call so lines from concurrent analyses don't interleave.
+        """
+        lines = []
+        if reddit_data["reddit_posts"] > 0:
+            sent = reddit_data["reddit_sentiment"]
+            label = "positive" if sent > 0.05 else "negative" if sent < -0.05 else "neutral"
+            lines.append(f"    Reddit... {reddit_data['reddit_posts']} posts ({label})")
+        else:
+            lines.append("    Reddit... no posts")
 
-            if reddit_data["reddit_posts"] > 0:
-                sent = reddit_data["reddit_sentiment"]
+        if amazon_data is not None:
+            if amazon_data["amazon_reviews_analyzed"] > 0:
+                sent = amazon_data["amazon_sentiment"]
                 label = "positive" if sent > 0.05 else "negative" if sent < -0.05 else "neutral"
-                print(f"{reddit_data['reddit_posts']} posts ({label})")
+                lines.append(f"    Amazon reviews... {amazon_data['amazon_reviews_analyzed']} reviews ({label})")
             else:
-                print("no posts")
+                lines.append("    Amazon reviews... no reviews")
 
-            # Amazon review sentiment (optional, adds time)
-            amazon_sentiment_data = {}
-            if include_amazon_sentiment and product.get('asin'):
-                print(f"    Amazon reviews...", end=" ")
-                amazon_sentiment_data = self.amazon.get_product_sentiment(
-                    product['asin'],
-                    self.sentiment,
-                    max_reviews=10
-                )
-                if amazon_sentiment_data["amazon_reviews_analyzed"] > 0:
-                    sent = amazon_sentiment_data["amazon_sentiment"]
-                    label = "positive" if sent > 0.05 else "negative" if sent < -0.05 else "neutral"
-                    print(f"{amazon_sentiment_data['amazon_reviews_analyzed']} reviews ({label})")
-                else:
-                    print("no reviews")
-
-            # Build result
-            result = {
-                "name": product['name'],
-                "niche_type": self._detect_niche_type(product.get('search_keyword', '')),
-                "related_topic": product.get('search_keyword', ''),
-                "amazon_url": product.get('url', ''),
-                "amazon_asin": product.get('asin', ''),
-                "price": product.get('price', 'N/A'),
-                "amazon_rating": product.get('rating', 0),
-                "amazon_review_count": product.get('reviews', 0),
-                "shopify_search_url": self._get_shopify_search_url(product['name']),
-                "keywords": keywords,
-            }
+        lines.append(f"    Score: {score:.1f}/100")
+        print("\n".join(lines))
 
-            # Add Reddit data
-            result.update(reddit_data)
+    def _search_category_products(
+        self,
+        category: str,
+        keywords: List[str],
+        products_per_keyword: int,
+        min_price: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Search Amazon for one category's keywords.
 
-            # Add Amazon sentiment data
-            result.update(amazon_sentiment_data)
+        Uses the shared self.amazon session, so searches and review scrapes
+        go through the same rate limiter and circuit breaker.
 
-            # Combined sentiment score (average of both if available)
-            result["combined_sentiment"] = self._calculate_combined_sentiment(
-                reddit_data, amazon_sentiment_data
+        Returns:
+            Products found for the category (empty on failure)
+        """
+        progress = None
+        if self.verbose:
+            progress = lambda i, t, k: print(f"  [{category} {i+1}/{t}] Searching: {k[:50]}")
+        try:
+            return self.amazon.search_products_batch(
+                keywords=keywords,
+                products_per_keyword=products_per_keyword,
+                min_price=min_price,
+                progress_callback=progress
             )
+        except Exception as e:
+            print(f"  [{category}] Amazon search failed: {e}")
+            return []
 
-            # Trend data
-            result["trend_score"] = 80
-            result["trend_direction"] = "rising"
+    def _analyze_product(self, product: Dict[str, Any], include_amazon_sentiment: bool) -> Dict[str, Any]:
+        """
+        Gather Reddit (and optionally Amazon review) sentiment for a product and score it.
 
-            # Calculate opportunity score
-            result["opportunity_score"] = self._calculate_opportunity_score(result)
-            print(f"    Score: {result['opportunity_score']:.1f}/100")
+        Args:
+            product: Product dict from the Amazon search
+            include_amazon_sentiment: Whether to scrape Amazon reviews for sentiment
 
-            results.append(result)
+        Returns:
+            Result dict with sentiment data and opportunity score
+        """
+        # Extract keywords for Reddit search
+        keywords = self._extract_keywords(product['name'])
 
-        # Sort by score
-        results.sort(key=lambda x: x["opportunity_score"], reverse=True)
+        # Reddit and Amazon reviews are different hosts, so fetch them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            reddit_future = executor.submit(self._get_reddit_sentiment, keywords, product['name'])
 
-        print("\n" + "=" * 70)
-        print(f"Discovery complete! Found {len(results)} opportunities")
-        print("=" * 70)
+            # Amazon review sentiment (optional, adds time)
+            amazon_future = None
+            if include_amazon_sentiment and product.get('asin'):
+                amazon_future = executor.submit(self._get_amazon_sentiment, product['asin'])
+
+            reddit_data = reddit_future.result()
+            amazon_sentiment_data = amazon_future.result() if amazon_future else {}
+
+
+        # Build result
+        result = {
+            "name": product['name'],
+            "niche_type": self._detect_niche_type(product.get('search_keyword', '')),
+            "related_topic": product.get('search_keyword', ''),
+            "amazon_url": product.get('url', ''),
+            "amazon_asin": product.get('asin', ''),
+            "price": product.get('price', 'N/A'),
+            "amazon_rating": product.get('rating', 0),
+            "amazon_review_count": product.get('reviews', 0),
+            "shopify_search_url": self._get_shopify_search_url(product['name']),
+            "keywords": keywords,
+        }
 
-        # Save to history database
-        self._save_to_history(
-            results=results,
-            mode="discover",
-            categories=categories or [],
-            settings={
-                "max_products": max_products,
-                "niche_types": niche_types,
-                "include_amazon_sentiment": include_amazon_sentiment,
-                "min_price": min_price
-            },
-            start_time=start_time
+        # Add Reddit data
+        result.update(reddit_data)
+
+        # Add Amazon sentiment data
+        result.update(amazon_sentiment_data)
+
+        # Combined sentiment score (average of both if available)
+        result["combined_sentiment"] = self._calculate_combined_sentiment(
+            reddit_data, amazon_sentiment_data
         )
 
-        return results
+        # Trend data
+        result["trend_score"] = 80
+        result["trend_direction"] = "rising"
+
+        # Calculate opportunity score
+        result["opportunity_score"] = self._calculate_opportunity_score(result)
+
+        if self.verbose:
+            self._print_sentiment_summary(
+                reddit_data,
+                amazon_sentiment_data if amazon_future else None,
+                result["opportunity_score"]
+            )
+
+        return result
 
     def _generate_niche_keywords(
         self,
@@ -372,54 +751,36 @@ class TrendsToProductsFinder:
             List of search keywords
         """
         keywords = []
+        seen = set()
+        limit = max_keywords_per_topic * len(topics)
 
         for topic in topics:
             topic_name = topic['title']
             topic_category = topic.get('category', 'general').lower()
 
             for niche_type in niche_types:
-                # Get patterns for this niche type
-                patterns = NICHE_PATTERNS.get(niche_type, [])
-
-                # Also get category-specific suffixes if available
-                category_suffixes = []
-                if topic_category in CATEGORY_NICHES:
-                    category_suffixes = CATEGORY_NICHES[topic_category].get(niche_type, [])
+                # Generic patterns + category-specific suffixes for this niche type
+                patterns = PATTERN_CACHE.get(
+                    (topic_category, niche_type),
+                    PATTERN_CACHE.get(("general", niche_type), ())
+                )
 
-                # Generate keywords from patterns
-                for pattern in patterns[:2]:  # Limit patterns per type
+                for pattern in patterns:
                     keyword = pattern.format(topic=topic_name)
-                    if keyword not in keywords:
-                        keywords.append(keyword)
-
-                # Generate keywords from category-specific suffixes
-                for suffix in category_suffixes[:2]:
-                    keyword = f"{topic_name} {suffix}"
-                    if keyword not in keywords:
+                    if keyword not in seen:
+                        seen.add(keyword)
                         keywords.append(keyword)
 
                 # Limit per topic
-                if len(keywords) >= max_keywords_per_topic * len(topics):
+                if len(keywords) >= limit:
                     break
 
         return keywords
 
     def _detect_niche_type(self, search_keyword: str) -> str:
         """Detect what type of niche a product belongs to based on search keyword."""
-        keyword_lower = search_keyword.lower()
-
-        accessory_words = ["case", "cover", "charger", "stand", "holder", "strap", "band", "mount", "bag", "screen protector"]
-        alternative_words = ["alternative", "budget", "cheap", "dupe", "like", "similar"]
-        complementary_words = ["bundle", "kit", "set", "starter", "compatible", "combo"]
-
-        if any(word in keyword_lower for word in accessory_words):
-            return "accessory"
-        elif any(word in keyword_lower for word in alternative_words):
-            return "alternative"
-        elif any(word in keyword_lower for word in complementary_words):
-            return "complementary"
-        else:
-            return "related"
+        match = NICHE_RE.match(search_keyword)
+        return match.lastgroup if match else "related"
 
     def _calculate_combined_sentiment(
         self,
@@ -449,36 +810,12 @@ class TrendsToProductsFinder:
 
     def _extract_keywords(self, product_name: str) -> List[str]:
         """Extract meaningful keywords from product name."""
-        # Clean the product name
-        clean_name = product_name.lower()
-
-        # Remove brand names, sizes, colors, etc.
-        clean_name = re.sub(r'\d+\s*(oz|ml|inch|pack|count|lb|kg|piece|set|mm|cm|ft)\b', '', clean_name, flags=re.IGNORECASE)
-        clean_name = re.sub(r'\([^)]*\)', '', clean_name)  # Remove parentheses
-        clean_name = re.sub(r'\[[^\]]*\]', '', clean_name)  # Remove brackets
-
-        # Stop words
-        stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for',
-            'from', 'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on',
-            'that', 'the', 'to', 'was', 'will', 'with', 'pack', 'set',
-            'new', 'best', 'top', 'premium', 'professional'
-        }
-
-        # Split and filter
-        words = re.findall(r'\w+', clean_name)
-        keywords = [
-            word for word in words
-            if word not in stop_words and len(word) > 2
-        ]
-
-        # Return top 3 most meaningful
-        return keywords[:3]
+        # Fresh list per call; the cached tuple is shared
+        return list(_name_keywords(product_name))
 
     def _get_shopify_search_url(self, product_name: str) -> str:
         """Generate Google search URL for Shopify stores."""
-        query = f'site:myshopify.com "{product_name}"'
-        return f"https://www.google.com/search?q={query.replace(' ', '+')}"
+        return _shopify_url(product_name)
 
     def _get_reddit_sentiment(self, keywords: List[str], full_name: str) -> Dict[str, Any]:
         """
@@ -498,140 +835,110 @@ class TrendsToProductsFinder:
         # e.g., "Ninja Fit Compact Personal Blender..." -> "Ninja Blender"
         brand_product = self._extract_brand_and_type(full_name)
 
-        # STEP 1: Search with brand + product type (most relevant)
-        posts = self.reddit.search_all_reddit(brand_product, limit=25)
+        # Near-duplicate names reduce to the same searches; reuse the result
+        cache_key = (brand_product.lower(), ' '.join(keywords[:2]).lower())
+        return self._single_flight(
+            self._reddit_sentiment_cache, cache_key,
+            lambda: self._fetch_reddit_sentiment(keywords, brand_product)
+        )
+
+    def _fetch_reddit_sentiment(self, keywords: List[str], brand_product: str) -> Dict[str, Any]:
+        """Search Reddit and score posts + comments (uncached)."""
+        # One search covering both the brand + product type (most relevant)
+        # and the broader top-2 keyword query, via Reddit's OR operator
+        keyword_query = ' '.join(keywords[:2])
+        if keyword_query and keyword_query.lower() != brand_product.lower():
+            query = f"({brand_product}) OR ({keyword_query})"
+        else:
+            query = brand_product
+        posts = self.reddit.search_all_reddit(query, limit=50)
 
         # Filter to posts that actually mention the product
-        relevant_posts = [
-            p for p in posts
-            if any(kw.lower() in (p.get('title', '') + ' ' + p.get('content', '')).lower()
-                   for kw in keywords[:2])  # Must contain at least one keyword
-        ]
-
-        # STEP 2: If not enough relevant posts, try broader keyword search
-        if len(relevant_posts) < 3:
-            query = ' '.join(keywords[:2])  # Use top 2 keywords only
-            posts = self.reddit.search_all_reddit(query, limit=25)
-            relevant_posts = [
-                p for p in posts
-                if any(kw.lower() in (p.get('title', '') + ' ' + p.get('content', '')).lower()
-                       for kw in keywords[:2])
-            ]
+        # (must contain at least one of the top-2 keywords)
+        relevant_posts = []
+        if keywords:
+            kw_pat = re.compile('|'.join(map(re.escape, keywords[:2])), re.IGNORECASE)
+            relevant_posts = self._filter_relevant(posts, kw_pat)
 
         if not relevant_posts:
-            return {
-                "reddit_posts": 0,
-                "reddit_sentiment": 0,
-                "reddit_positive": 0,
-                "reddit_negative": 0,
-                "sentiment_ratio": 0.5,
-            }
+            return empty_reddit_sentiment()
 
-        # Analyze sentiment on RELEVANT posts AND their comments
-        sentiments = []
+        # Collect RELEVANT posts AND their comments, then score them in one batch
+        texts = []
+        weights = []
         total_comments_analyzed = 0
 
-        # Analyze top posts and fetch their comments
-        for post in relevant_posts[:10]:  # Limit to top 10 posts for comments
-            # Analyze post title + body
-            post_text = f"{post.get('title', '')} {post.get('content', '')}"
-            label, score = self.sentiment.get_sentiment_label(post_text)
-            sentiments.append({
-                "label": label,
-                "score": score,
-                "upvotes": post.get("upvotes", 0),
-                "type": "post",
-            })
-
-            # Fetch and analyze comments from this post
-            post_id = post.get("platform_id", "")
-            subreddit = post.get("subreddit", "")
-
-            if post_id and subreddit:
-                comments = self.reddit.scrape_comments(subreddit, post_id, limit=15)
+        # Analyze top posts; their comment threads are queued on worker threads
+        # (gated by the shared Reddit rate limit) and consumed in post order
+        top_posts = relevant_posts[:10]  # Limit to top 10 posts for comments
+        with ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS) as executor:
+            comment_lists = executor.map(self._fetch_post_comments, (post for post, _ in top_posts))
+
+            for (post, text), comments in zip(top_posts, comment_lists):
+                # Post title + body
+                texts.append(text)
+                weights.append(max(post.get("upvotes", 0), 1))
+
                 for comment in comments:
                     comment_text = comment.get("content", "")
                     if comment_text and len(comment_text) > 10:
-                        c_label, c_score = self.sentiment.get_sentiment_label(comment_text)
-                        sentiments.append({
-                            "label": c_label,
-                            "score": c_score,
-                            "upvotes": comment.get("upvotes", 0),
-                            "type": "comment",
-                        })
+                        texts.append(comment_text)
+                        # Comments get 0.8x the weight of posts
+                        weights.append(max(comment.get("upvotes", 0), 1) * 0.8)
                         total_comments_analyzed += 1
 
-        # Weighted sentiment (comments weighted slightly less than posts)
-        total_weight = 0
-        weighted_sum = 0
-        for s in sentiments:
-            weight = max(s["upvotes"], 1)
-            # Posts get full weight, comments get 0.8x weight
-            if s["type"] == "comment":
-                weight *= 0.8
-            total_weight += weight
-            weighted_sum += s["score"] * weight
+        labeled = self.sentiment.get_sentiment_labels_batch(texts)
 
-        weighted_sentiment = weighted_sum / total_weight if total_weight > 0 else 0
+        # Weighted sentiment (comments weighted slightly less than posts)
+        result = summarize_sentiment(labeled, weights, len(relevant_posts))
+        result["reddit_comments"] = total_comments_analyzed
+        return result
+
+    def _fetch_post_comments(self, post: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch up to 15 comments for a Reddit post (empty if it has no id/subreddit)."""
+        post_id = post.get("platform_id", "")
+        subreddit = post.get("subreddit", "")
+        if not (post_id and subreddit):
+            return []
+        return self.reddit.scrape_comments(subreddit, post_id, limit=15)
 
-        positive_count = sum(1 for s in sentiments if s["label"] == "positive")
-        negative_count = sum(1 for s in sentiments if s["label"] == "negative")
+    @staticmethod
+    def _filter_relevant(posts: List[Dict[str, Any]], kw_pat: re.Pattern) -> List[tuple]:
+        """
+        Keep posts whose title or body matches the keyword pattern.
 
-        return {
-            "reddit_posts": len(relevant_posts),
-            "reddit_comments": total_comments_analyzed,
-            "reddit_sentiment": round(weighted_sentiment, 3),
-            "reddit_positive": positive_count,
-            "reddit_negative": negative_count,
-            "sentiment_ratio": round(
-                positive_count / max(positive_count + negative_count, 1), 2
-            ),
-        }
+        Returns:
+            (post, "title content") pairs, so the text built for matching is
+            reused for sentiment scoring
+        """
+        texts = (f"{p.get('title', '')} {p.get('content', '')}" for p in posts)
+        return [(p, text) for p, text in zip(posts, texts) if kw_pat.search(text)]
 
-    def _detect_seasonality(self, product_name: str) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _detect_seasonality(product_name: str) -> Dict[str, Any]:
         """
         Detect if a product is seasonal based on keywords.
 
         Returns:
             Dictionary with is_seasonal, season_type, and warning
+            (cached per name; read it, don't modify it)
         """
-        name_lower = product_name.lower()
-
-        # Seasonal keyword patterns
-        seasonal_patterns = {
-            "christmas": ["christmas", "xmas", "santa", "reindeer", "snowman", "ornament", "stocking"],
-            "halloween": ["halloween", "costume", "spooky", "pumpkin", "witch", "ghost", "skeleton"],
-            "valentines": ["valentine", "heart shaped", "romantic", "cupid"],
-            "easter": ["easter", "bunny", "egg hunt"],
-            "thanksgiving": ["thanksgiving", "turkey", "pilgrim"],
-            "summer": ["beach", "pool float", "sunscreen", "swimsuit", "bikini", "surfboard", "patio"],
-            "winter": ["snow blower", "ice scraper", "heated blanket", "space heater", "snow shovel"],
-            "back_to_school": ["backpack", "school supplies", "lunchbox", "pencil case", "binder"],
-            "new_years": ["new year", "party supplies", "champagne", "countdown"],
-            "mothers_day": ["mothers day", "mom gift"],
-            "fathers_day": ["fathers day", "dad gift"],
-            "black_friday": ["black friday", "cyber monday"],
-        }
-
-        # Check for matches
-        for season, keywords in seasonal_patterns.items():
-            for keyword in keywords:
-                if keyword in name_lower:
-                    return {
-                        "is_seasonal": True,
-                        "season_type": season.replace("_", " ").title(),
-                        "seasonality_warning": f"⚠️ Seasonal product ({season.replace('_', ' ')})",
-                    }
-
-        # Check for general holiday/event patterns
-        holiday_words = ["holiday", "festive", "celebration", "party"]
-        for word in holiday_words:
-            if word in name_lower:
+        match = SEASON_RE.match(product_name)
+        if match:
+            season = match.lastgroup
+            if season == "holiday":
+                # General holiday/event wording
                 return {
                     "is_seasonal": True,
                     "season_type": "Holiday/Event",
                     "seasonality_warning": "⚠️ Possible seasonal product",
                 }
+            return {
+                "is_seasonal": True,
+                "season_type": season.replace("_", " ").title(),
+                "seasonality_warning": f"⚠️ Seasonal product ({season.replace('_', ' ')})",
+            }
 
         return {
             "is_seasonal": False,
@@ -655,16 +962,11 @@ class TrendsToProductsFinder:
         Returns:
             Dictionary with sourcing data
         """
-        import urllib.parse
-
         # Extract key search terms (remove brand names, focus on product type)
         search_terms = self._extract_sourcing_keywords(product_name)
-        encoded_query = urllib.parse.quote(search_terms)
 
         # Generate search URLs
-        alibaba_url = f"https://www.alibaba.com/trade/search?SearchText={encoded_query}"
-        aliexpress_url = f"https://www.aliexpress.com/wholesale?SearchText={encoded_query}"
-        made_in_china_url = f"https://www.made-in-china.com/products-search/hot-china-products/{encoded_query}.html"
+        alibaba_url, aliexpress_url, made_in_china_url = _sourcing_urls(search_terms)
 
         # Estimate supplier prices based on typical markup ratios
         # Amazon products typically have 3-5x markup from Alibaba
@@ -700,43 +1002,47 @@ class TrendsToProductsFinder:
             "sourcing_recommendation": sourcing_rec,
         }
 
-    def _extract_sourcing_keywords(self, product_name: str) -> str:
+    def _enrich_product(self, result: Dict[str, Any]) -> None:
+        """
+        Add profit, seasonality, competition and sourcing fields to a result.
+
+        The price string is parsed once and the number is shared by the
+        profit and sourcing estimates.
+        """
+        price = parse_price(result.get("price", "0"))
+
+        # Calculate profit margin estimate
+        result.update(self._profit_margin_for_price(price))
+
+        # Detect seasonality
+        result.update(self._detect_seasonality(result["name"]))
+
+        # Calculate competition score
+        result.update(self._calculate_competition_score(
+            result.get("amazon_review_count", 0),
+            result.get("amazon_rating", 0)
+        ))
+
+        # Get sourcing data (Alibaba/AliExpress URLs + estimated supplier price)
+        result.update(self._get_sourcing_data(result["name"], price))
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_sourcing_keywords(product_name: str) -> str:
         """
         Extract clean search terms for supplier search.
 
         Removes brand names and focuses on product type.
         """
-        # Common brand prefixes to remove
-        brand_indicators = [
-            "amazon", "ninja", "cuisinart", "instant", "keurig", "dyson",
-            "shark", "bissell", "hoover", "breville", "kitchenaid", "hamilton",
-            "black+decker", "oster", "sunbeam", "fit geno", "upright go",
-        ]
-
-        name_lower = product_name.lower()
-
-        # Remove brand names
-        for brand in brand_indicators:
-            name_lower = name_lower.replace(brand, "")
-
-        # Remove common filler words
-        filler_words = [
-            "premium", "deluxe", "professional", "advanced", "ultimate",
-            "best", "top", "rated", "new", "upgraded", "improved", "2024", "2025",
-            "for women", "for men", "for women and men", "unisex",
-        ]
-
-        for filler in filler_words:
-            name_lower = name_lower.replace(filler, "")
-
-        # Clean up and take first 5 words
-        import re
-        words = re.findall(r'\b[a-z]+\b', name_lower)
-        # Filter out very short words
-        words = [w for w in words if len(w) > 2]
+        # Drop brand names and filler words in one pass, then take the
+        # first 5 remaining words (very short words filtered out)
+        cleaned = _BRAND_FILLER_RE.sub(' ', product_name.lower())
+        words = [w for w in _LOWER_WORD_RE.findall(cleaned) if len(w) > 2]
         return ' '.join(words[:5])
 
-    def _calculate_competition_score(self, review_count: int, rating: float) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_competition_score(review_count: int, rating: float) -> Dict[str, Any]:
         """
         Calculate competition score based on market indicators.
 
@@ -747,33 +1053,16 @@ class TrendsToProductsFinder:
             rating: Amazon star rating (0-5)
 
         Returns:
-            Dictionary with competition metrics
+            Dictionary with competition metrics (cached; read it, don't modify it)
         """
         # Competition level based on review count
         if review_count == 0:
             competition_level = "Unknown"
             competition_score = 50  # Neutral - no data
-        elif review_count < 100:
-            competition_level = "Very Low"
-            competition_score = 10  # Great opportunity
-        elif review_count < 500:
-            competition_level = "Low"
-            competition_score = 25
-        elif review_count < 1000:
-            competition_level = "Low-Medium"
-            competition_score = 40
-        elif review_count < 2500:
-            competition_level = "Medium"
-            competition_score = 55
-        elif review_count < 5000:
-            competition_level = "Medium-High"
-            competition_score = 70
-        elif review_count < 10000:
-            competition_level = "High"
-            competition_score = 85
         else:
-            competition_level = "Very High"
-            competition_score = 95  # Saturated market
+            tier = bisect_right(COMPETITION_REVIEW_THRESHOLDS, review_count)
+            competition_level = COMPETITION_LEVELS[tier]
+            competition_score = COMPETITION_SCORES[tier]
 
         # Adjust for rating (high rating = established competition)
         if rating >= 4.5 and review_count > 1000:
@@ -781,14 +1070,7 @@ class TrendsToProductsFinder:
             competition_level += " (Strong incumbent)"
 
         # Market entry difficulty
-        if competition_score < 30:
-            entry_difficulty = "Easy"
-        elif competition_score < 50:
-            entry_difficulty = "Moderate"
-        elif competition_score < 70:
-            entry_difficulty = "Challenging"
-        else:
-            entry_difficulty = "Difficult"
+        entry_difficulty = ENTRY_DIFFICULTIES[bisect_right(ENTRY_DIFFICULTY_THRESHOLDS, competition_score)]
 
         return {
             "competition_score": competition_score,
@@ -812,16 +1094,10 @@ class TrendsToProductsFinder:
         Returns:
             Dictionary with margin estimates
         """
-        # Parse price
-        price = 0.0
-        if price_str and price_str != "N/A":
-            try:
-                import re
-                clean = re.sub(r'[^\d.]', '', price_str)
-                price = float(clean) if clean else 0.0
-            except (ValueError, TypeError):
-                price = 0.0
+        return self._profit_margin_for_price(parse_price(price_str), cogs_percent)
 
+    def _profit_margin_for_price(self, price: float, cogs_percent: float = 0.30) -> Dict[str, Any]:
+        """Estimate profit margin for an already-parsed price (see _estimate_profit_margin)."""
         if price == 0:
             return {
                 "selling_price": 0,
@@ -862,7 +1138,9 @@ class TrendsToProductsFinder:
             "profit_margin_pct": round(margin_pct, 1),
         }
 
-    def _extract_brand_and_type(self, product_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_brand_and_type(product_name: str) -> str:
         """
         Extract brand name and product type from full product name.
 
@@ -870,27 +1148,13 @@ class TrendsToProductsFinder:
              "AMZCHEF Portable Blender, Strong..." -> "AMZCHEF Blender"
              "Fit Geno Back Brace Posture Corrector..." -> "Fit Geno Posture Corrector"
         """
-        # Common product types to look for
-        product_types = [
-            "blender", "massager", "posture corrector", "back brace",
-            "air fryer", "watch", "earbuds", "headphones", "speaker",
-            "vacuum", "charger", "case", "stand", "mat", "band",
-            "tracker", "scale", "monitor", "lamp", "fan", "heater",
-            "humidifier", "purifier", "cooker", "grill", "toaster",
-            "mixer", "juicer", "processor", "maker", "kettle",
-        ]
-
-        name_lower = product_name.lower()
-
         # Find product type
-        found_type = None
-        for ptype in product_types:
-            if ptype in name_lower:
-                found_type = ptype.title()
-                break
-
-        # Get first word as brand (usually capitalized brand names)
-        words = product_name.split()
+        match = _PTYPE_RE.search(product_name)
+        found_type = match.group(1).title() if match else None
+
+        # Get first word as brand (usually capitalized brand names); only the
+        # first 3 words are ever used, so stop splitting there
+        words = product_name.split(maxsplit=3)[:3]
         brand = words[0] if words else ""
 
         # Build search query
@@ -898,7 +1162,7 @@ class TrendsToProductsFinder:
             return f"{brand} {found_type}"
         else:
             # Return first 3 words as fallback
-            return ' '.join(words[:3])
+            return ' '.join(words)
 
     def _calculate_opportunity_score(self, product: Dict[str, Any]) -> float:
         """
@@ -911,88 +1175,64 @@ class TrendsToProductsFinder:
         - Niche type bonus (0-10 pts for accessories/alternatives)
         - Discussion/validation bonus (0-10 pts)
         """
-        import math
+        # Bound once; the product dict is read ~15 times below
+        get = product.get
 
         # Base score for being related to a trending topic
         base_score = 30
 
         # Amazon competition (0-25 pts)
         # Fewer reviews = less saturated = higher score
-        reviews = product.get("amazon_review_count", product.get("amazon_reviews", 0))
-
-        if reviews == 0:
-            competition_score = 25  # Unknown competition, assume opportunity
-        elif reviews < 50:
-            competition_score = 25  # Very low competition
-        elif reviews < 200:
-            competition_score = 20  # Low competition
-        elif reviews < 1000:
-            competition_score = 15  # Moderate competition
-        elif reviews < 5000:
-            competition_score = 10  # High competition
-        else:
-            competition_score = 5   # Very saturated
+        reviews = get("amazon_review_count", get("amazon_reviews", 0))
+
+        competition_score = OPPORTUNITY_REVIEW_SCORES[bisect_right(OPPORTUNITY_REVIEW_THRESHOLDS, reviews)]
 
         # Combined sentiment (0-25 pts)
         # Use combined_sentiment if available, else fall back to reddit or amazon
-        sentiment = product.get("combined_sentiment", 0)
-        if sentiment == 0:
-            sentiment = product.get("amazon_sentiment", product.get("reddit_sentiment", 0))
+        sentiment = get("combined_sentiment", 0) or get("amazon_sentiment", get("reddit_sentiment", 0))
 
         # Convert -1 to 1 range to 0-25 points
         sentiment_score = ((sentiment + 1) / 2) * 25
 
         # Niche type bonus (0-10 pts)
         # Accessories and alternatives often have better margins
-        niche_type = product.get("niche_type", "")
-        niche_bonus = 0
-        if niche_type == "accessory":
-            niche_bonus = 10  # Accessories often have high margins
-        elif niche_type == "alternative":
-            niche_bonus = 8   # Budget alternatives can capture value-conscious buyers
-        elif niche_type == "complementary":
-            niche_bonus = 6   # Bundles/kits can differentiate
+        niche_bonus = NICHE_BONUSES.get(get("niche_type", ""), 0)
 
         # Validation bonus (0-10 pts)
         # More data sources = higher confidence
         validation_bonus = 0
 
-        reddit_posts = product.get("reddit_posts", 0)
-        amazon_reviews_analyzed = product.get("amazon_reviews_analyzed", 0)
+        reddit_posts = get("reddit_posts", 0)
+        amazon_reviews_analyzed = get("amazon_reviews_analyzed", 0)
 
         # Bonus for having Reddit discussion
         if reddit_posts > 0:
-            validation_bonus += min(3, math.log10(reddit_posts + 1) * 2)
+            validation_bonus += min(3, log_volume(reddit_posts) * 2)
 
         # Bonus for having analyzed Amazon reviews
         if amazon_reviews_analyzed > 0:
             validation_bonus += min(4, amazon_reviews_analyzed / 3)
 
         # Bonus for high Amazon product rating
-        rating = product.get("amazon_rating", 0)
-        if rating >= 4.5:
-            validation_bonus += 3
-        elif rating >= 4.0:
-            validation_bonus += 2
-        elif rating >= 3.5:
-            validation_bonus += 1
+        rating = get("amazon_rating", 0)
+        validation_bonus += OPPORTUNITY_RATING_BONUSES[bisect_right(OPPORTUNITY_RATING_THRESHOLDS, rating)]
 
         # Calculate final score
         final_score = base_score + competition_score + sentiment_score + niche_bonus + validation_bonus
 
         # Bonuses for strong positive signals
-        reddit_ratio = product.get("sentiment_ratio", 0.5)
-        amazon_ratio = product.get("amazon_sentiment_ratio", 0.5)
+        reddit_ratio = get("sentiment_ratio", 0.5)
+        amazon_ratio = get("amazon_sentiment_ratio", 0.5)
         combined_ratio = (reddit_ratio + amazon_ratio) / 2 if amazon_ratio != 0.5 else reddit_ratio
 
         if combined_ratio > 0.75:
             final_score += 5  # Strong positive sentiment
 
         # Penalties for negative signals
-        reddit_negative = product.get("reddit_negative", 0)
-        reddit_positive = product.get("reddit_positive", 0)
-        amazon_negative = product.get("amazon_negative", 0)
-        amazon_positive = product.get("amazon_positive", 0)
+        reddit_negative = get("reddit_negative", 0)
+        reddit_positive = get("reddit_positive", 0)
+        amazon_negative = get("amazon_negative", 0)
+        amazon_positive = get("amazon_positive", 0)
 
         total_negative = reddit_negative + amazon_negative
         total_positive = reddit_positive + amazon_positive
@@ -1002,6 +1242,117 @@ class TrendsToProductsFinder:
 
         return round(min(100, max(0, final_score)), 1)
 
+    def _prescore_without_sentiment(self, product: Dict[str, Any]) -> float:
+        """
+        Upper bound of a raw Amazon search result's opportunity score.
+
+        Competition, rating and niche points are known before any Reddit
+        lookup; sentiment and discussion points are assumed maximal.
+        """
+        reviews = product.get("reviews", 0)
+        rating = product.get("rating", 0)
+        niche_type = self._detect_niche_type(product.get("search_keyword", ""))
+
+        return (
+            30
+            + OPPORTUNITY_REVIEW_SCORES[bisect_right(OPPORTUNITY_REVIEW_THRESHOLDS, reviews)]
+            + NICHE_BONUSES.get(niche_type, 0)
+            + OPPORTUNITY_RATING_BONUSES[bisect_right(OPPORTUNITY_RATING_THRESHOLDS, rating)]
+            + 25  # Best possible sentiment
+            + 3   # Reddit discussion bonus
+            + 5   # Strong positive sentiment bonus
+        )
+
+    def _calculate_reddit_only_score(self, product: Dict[str, Any]) -> float:
+        """
+        _calculate_opportunity_score for products with Reddit data only.
+
+        Used by async discovery, where combined_sentiment is the Reddit
+        sentiment and no Amazon reviews are analyzed, so the Amazon sentiment
+        fallbacks, review bonus and ratio averaging are dropped.
+        """
+        get = product.get
+
+        final_score = (
+            30
+            + OPPORTUNITY_REVIEW_SCORES[bisect_right(OPPORTUNITY_REVIEW_THRESHOLDS, get("amazon_review_count", 0))]
+            + (get("reddit_sentiment", 0) + 1) / 2 * 25
+            + NICHE_BONUSES.get(get("niche_type", ""), 0)
+            + OPPORTUNITY_RATING_BONUSES[bisect_right(OPPORTUNITY_RATING_THRESHOLDS, get("amazon_rating", 0))]
+        )
+
+        reddit_posts = get("reddit_posts", 0)
+        if reddit_posts > 0:
+            final_score += min(3, log_volume(reddit_posts) * 2)
+
+        if get("sentiment_ratio", 0.5) > 0.75:
+            final_score += 5  # Strong positive sentiment
+
+        reddit_negative = get("reddit_negative", 0)
+        if reddit_negative > get("reddit_positive", 0) and reddit_negative > 2:
+            final_score -= 15  # Strong negative signal
+
+        return round(min(100, max(0, final_score)), 1)
+
+    def _score_products(self, products: List[Dict[str, Any]], reddit_only: bool = False) -> None:
+        """
+        Set opportunity_score on every product (see _calculate_opportunity_score).
+
+        Large batches are scored column-wise with NumPy; small ones fall back
+        to the per-product version (the Reddit-only one if reddit_only).
+        """
+        n = len(products)
+        if n < BATCH_SCORE_MIN_PRODUCTS:
+            score = self._calculate_reddit_only_score if reddit_only else self._calculate_opportunity_score
+            for product in products:
+                product["opportunity_score"] = score(product)
+            return
+
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=n)
+
+        def field(key: str, default: float = 0) -> np.ndarray:
+            return column(p.get(key, default) for p in products)
+
+        # Same fallbacks as the per-product version
+        reviews = column(p.get("amazon_review_count", p.get("amazon_reviews", 0)) for p in products)
+        sentiment = column(
+            p.get("combined_sentiment", 0) or p.get("amazon_sentiment", p.get("reddit_sentiment", 0))
+            for p in products
+        )
+        niche_bonus = column(NICHE_BONUSES.get(p.get("niche_type", ""), 0) for p in products)
+        reddit_posts = field("reddit_posts")
+        amazon_reviews_analyzed = field("amazon_reviews_analyzed")
+
+        # Base + competition + sentiment + niche (see tables above)
+        competition_score = np.take(
+            OPPORTUNITY_REVIEW_SCORES, np.searchsorted(OPPORTUNITY_REVIEW_THRESHOLDS, reviews, side="right")
+        )
+        final_scores = 30 + competition_score + (sentiment + 1) / 2 * 25 + niche_bonus
+
+        # Validation bonus
+        final_scores += np.where(reddit_posts > 0, np.minimum(3, np.log10(np.maximum(reddit_posts, 0) + 1) * 2), 0)
+        final_scores += np.where(amazon_reviews_analyzed > 0, np.minimum(4, amazon_reviews_analyzed / 3), 0)
+        final_scores += np.take(
+            OPPORTUNITY_RATING_BONUSES,
+            np.searchsorted(OPPORTUNITY_RATING_THRESHOLDS, field("amazon_rating"), side="right")
+        )
+
+        # Strong positive sentiment
+        reddit_ratio = field("sentiment_ratio", 0.5)
+        amazon_ratio = field("amazon_sentiment_ratio", 0.5)
+        combined_ratio = np.where(amazon_ratio != 0.5, (reddit_ratio + amazon_ratio) / 2, reddit_ratio)
+        final_scores += np.where(combined_ratio > 0.75, 5, 0)
+
+        # Strong negative signal
+        total_negative = field("reddit_negative") + field("amazon_negative")
+        total_positive = field("reddit_positive") + field("amazon_positive")
+        final_scores -= np.where((total_negative > total_positive) & (total_negative > 2), 15, 0)
+
+        final_scores = np.round(np.clip(final_scores, 0, 100), 1)
+        for product, score in zip(products, final_scores.tolist()):
+            product["opportunity_score"] = score
+
     # =========================================================================
     # ASYNC VERSION - Parallel Reddit sentiment for 3-4x speedup
     # =========================================================================
@@ -1013,7 +1364,8 @@ class TrendsToProductsFinder:
         products_per_topic: int = 3,
         niche_types: List[str] = None,
         min_price: float = 0.0,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        max_concurrency: int = 8
     ) -> List[Dict[str, Any]]:
         """
         Async version of discover_opportunities with parallel Reddit sentiment.
@@ -1030,6 +1382,7 @@ class TrendsToProductsFinder:
             niche_types: Types of niches to find
             min_price: Minimum price filter (default 0 = no filter)
             progress_callback: Optional callback(step, total, item, message)
+            max_concurrency: Products whose Reddit sentiment is fetched at once
 
         Returns:
             List of top opportunities sorted by score
@@ -1038,7 +1391,7 @@ class TrendsToProductsFinder:
             niche_types = ["accessories", "alternatives", "complementary"]
 
         # Track start time for history
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
 
         def update_progress(step: int, total: int, item: str = "", message: str = ""):
             if progress_callback:
@@ -1098,8 +1451,9 @@ class TrendsToProductsFinder:
 
         print(f"\n  Found {len(products)} unique products")
 
-        # Limit to max_products for sentiment analysis
-        products_to_analyze = products[:max_products]
+        # Limit to max_products for sentiment analysis: the ones with the
+        # highest score ceiling before sentiment (ties keep search order)
+        products_to_analyze = heapq.nlargest(max_products, products, key=self._prescore_without_sentiment)
 
         # STEP 4: Parallel Reddit sentiment (KEY SPEEDUP)
         print(f"\n[STEP 4] Analyzing Reddit sentiment (parallel, {len(products_to_analyze)} products)...")
@@ -1108,6 +1462,7 @@ class TrendsToProductsFinder:
 
         products_with_sentiment = await self._get_sentiment_parallel(
             products_to_analyze,
+            max_workers=max_concurrency,
             progress_callback=progress_callback
         )
 
@@ -1131,14 +1486,13 @@ class TrendsToProductsFinder:
             # Combined sentiment (Reddit only in fast mode)
             product["combined_sentiment"] = product.get("reddit_sentiment", 0)
 
-            # Calculate opportunity score
-            product["opportunity_score"] = self._calculate_opportunity_score(product)
-
             results.append(product)
 
-        # Sort by score and return top results
-        results.sort(key=lambda x: x["opportunity_score"], reverse=True)
-        final_results = results[:max_products]
+        # Calculate opportunity scores in one pass (Reddit data only here)
+        self._score_products(results, reddit_only=True)
+
+        # Top results by score (partial selection, no full sort)
+        final_results = heapq.nlargest(max_products, results, key=itemgetter("opportunity_score"))
 
         print("\n" + "=" * 70)
         print(f"Discovery complete! Top {len(final_results)} opportunities:")
@@ -1171,24 +1525,26 @@ class TrendsToProductsFinder:
         """
         Get Reddit sentiment for products in parallel.
 
-        Uses AsyncWorkerPool for bounded concurrency.
+        A semaphore bounds how many searches run at once; the scraper itself
+        spaces the requests by `delay`.
         Key change: Searches by FULL PRODUCT NAME, not keywords.
 
         Args:
             products: List of products to analyze
-            max_workers: Concurrent Reddit requests (default 3)
+            max_workers: Products analyzed concurrently (default 3)
             delay: Delay between requests (default 10s)
             progress_callback: Optional progress callback
 
         Returns:
             Products with sentiment data added
         """
+        # The scraper already spaces its own requests by `delay`, so all that is
+        # needed here is a bound on concurrent searches
         async_reddit = AsyncRedditScraper(delay=delay)
-        worker_pool = AsyncWorkerPool(max_workers=max_workers, delay_between_tasks=delay)
+        sem = asyncio.Semaphore(max_workers)
 
-        async def analyze_single(product: Dict[str, Any]) -> Dict[str, Any]:
-            """Analyze sentiment for a single product."""
-            product_name = product['name']
+        async def analyze_single(product_name: str) -> Dict[str, Any]:
+            """Analyze sentiment for a single product name."""
             print(f"    Reddit: {product_name[:40]}...", end=" ")
 
             sentiment_data = await async_reddit.search_product_sentiment(
@@ -1202,21 +1558,45 @@ class TrendsToProductsFinder:
             else:
                 print("no posts")
 
-            return {**product, **sentiment_data}
-
-        # Create coroutines for all products
-        coroutines = [analyze_single(p) for p in products]
-
-        # Execute in parallel with bounded concurrency
-        results = await worker_pool.execute_batch(
-            coroutines,
-            progress_callback=lambda done, total, msg: (
-                progress_callback(done, total, "", f"Sentiment: {done}/{total}") if progress_callback else None
-            )
-        )
-
-        # Filter out any errors
-        return [r for r in results if not isinstance(r, dict) or "error" not in r]
+            return sentiment_data
+
+        # Listings with the same name (variants, resellers under other ASINs)
+        # would run identical searches; search once per name and share it
+        by_name: Dict[str, List[Dict[str, Any]]] = {}
+        for product in products:
+            by_name.setdefault(product['name'].strip().lower(), []).append(product)
+        groups = list(by_name.values())
+
+        total = len(groups)
+        completed = 0
+
+        async def bounded(product_name: str) -> Optional[Dict[str, Any]]:
+            """Run one search under the semaphore; a failed search yields None."""
+            nonlocal completed
+            async with sem:
+                try:
+                    sentiment_data = await analyze_single(product_name)
+                except Exception as e:
+                    print(f"    Reddit search failed for {product_name[:40]}: {str(e)[:100]}")
+                    return None
+
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, "", f"Sentiment: {completed}/{total}")
+            return sentiment_data
+
+        # One search per distinct name, bounded concurrency
+        results = await asyncio.gather(*(bounded(group[0]['name']) for group in groups))
+
+        # Fan each result out to its listings in place, skipping failed searches
+        analyzed = []
+        for group, sentiment_data in zip(groups, results):
+            if sentiment_data is None:
+                continue
+            for product in group:
+                product.update(sentiment_data)
+            analyzed.extend(group)
+        return analyzed
 
     def discover_opportunities_fast(
         self,
@@ -1225,21 +1605,24 @@ class TrendsToProductsFinder:
         products_per_topic: int = 3,
         niche_types: List[str] = None,
         min_price: float = 0.0,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        max_concurrency: int = 8
     ) -> List[Dict[str, Any]]:
         """
         Fast synchronous wrapper for async discovery.
 
         Use this for CLI/scripts.
         Note: On Windows, uses ProactorEventLoop (default) for Playwright compatibility.
+        The event loop is reused by later calls from the same thread.
         """
-        return asyncio.run(self.discover_opportunities_async(
+        return _get_runner().run(self.discover_opportunities_async(
             categories=categories,
             max_products=max_products,
             products_per_topic=products_per_topic,
             niche_types=niche_types,
             min_price=min_price,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            max_concurrency=max_concurrency
         ))
 
     def search_custom_keywords(
@@ -1267,7 +1650,8 @@ class TrendsToProductsFinder:
             List of products with sentiment data and scores
         """
         # Track start time for history
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
+        self._reset_run_caches()
 
         print("\n" + "=" * 70)
         print("CUSTOM KEYWORD SEARCH")
@@ -1282,123 +1666,111 @@ class TrendsToProductsFinder:
             print(f"  (filtering for products >= ${min_price:.0f})")
         print("-" * 50)
 
-        products = self.amazon.search_products_batch(
-            keywords=keywords,
-            products_per_keyword=products_per_keyword,
-            min_price=min_price,
-            progress_callback=lambda i, t, k: print(f"  [{i+1}/{t}] Searching: {k[:40]}...")
-        )
-
-        if not products:
-            print("  No products found on Amazon")
-            return []
-
-        print(f"\n  Found {len(products)} products")
-
-        # Limit to max_products
-        products_to_analyze = products[:max_products]
-
-        # STEP 2: Get Reddit sentiment
-        print(f"\n[STEP 2] Getting Reddit sentiment ({len(products_to_analyze)} products)...")
-        print("-" * 50)
+        # One warm browser serves every search and review scrape of this run
+        with self.amazon:
+            products = self.amazon.search_products_batch(
+                keywords=keywords,
+                products_per_keyword=products_per_keyword,
+                min_price=min_price,
+                progress_callback=lambda i, t, k: print(f"  [{i+1}/{t}] Searching: {k[:40]}...")
+            )
 
-        results = []
-        for i, product in enumerate(products_to_analyze):
-            name = product['name']
-            asin = product.get('asin', '')
-            print(f"  [{i+1}/{len(products_to_analyze)}] {name[:50]}...")
-
-            # Get Reddit sentiment
-            print(f"    Reddit...", end=" ")
-            keywords_extracted = self._extract_keywords(name)
-            reddit_data = self._get_reddit_sentiment(keywords_extracted, name)
-
-            if reddit_data["reddit_posts"] > 0:
-                sent = reddit_data["reddit_sentiment"]
-                label = "+" if sent > 0.05 else "-" if sent < -0.05 else "~"
-                comments = reddit_data.get("reddit_comments", 0)
-                print(f"{reddit_data['reddit_posts']} posts, {comments} comments ({label})")
-            else:
-                print("no posts")
+            if not products:
+                print("  No products found on Amazon")
+                return []
+
+            print(f"\n  Found {len(products)} products")
+
+            # Limit to max_products
+            products_to_analyze = products[:max_products]
+
+            # STEP 2: Get Reddit sentiment
+            print(f"\n[STEP 2] Getting Reddit sentiment ({len(products_to_analyze)} products)...")
+            print("-" * 50)
+
+            results = []
+            for i, product in enumerate(products_to_analyze):
+                name = product['name']
+                asin = product.get('asin', '')
+                if self.verbose:
+                    print(f"  [{i+1}/{len(products_to_analyze)}] {name[:50]}...")
+
+                # Reddit sentiment and Amazon review sentiment (optional - slower but
+                # more accurate) hit different hosts, so fetch them side by side
+                keywords_extracted = self._extract_keywords(name)
+                fetch_amazon = include_amazon_reviews and asin
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    reddit_future = executor.submit(self._get_reddit_sentiment, keywords_extracted, name)
+                    amazon_future = (
+                        executor.submit(self._get_amazon_sentiment, asin, max_reviews=15)
+                        if fetch_amazon else None
+                    )
+                    reddit_data = reddit_future.result()
+                    amazon_sentiment_data = amazon_future.result() if amazon_future else {}
+
+                if self.verbose:
+                    # One write per product rather than one per line
+                    if reddit_data["reddit_posts"] > 0:
+                        sent = reddit_data["reddit_sentiment"]
+                        label = "+" if sent > 0.05 else "-" if sent < -0.05 else "~"
+                        comments = reddit_data.get("reddit_comments", 0)
+                        lines = [f"    Reddit... {reddit_data['reddit_posts']} posts, {comments} comments ({label})"]
+                    else:
+                        lines = ["    Reddit... no posts"]
+
+                    if fetch_amazon:
+                        if amazon_sentiment_data.get("amazon_reviews_analyzed", 0) > 0:
+                            sent = amazon_sentiment_data["amazon_sentiment"]
+                            label = "+" if sent > 0.05 else "-" if sent < -0.05 else "~"
+                            lines.append(
+                                f"    Amazon reviews... {amazon_sentiment_data['amazon_reviews_analyzed']} reviews ({label})"
+                            )
+                        else:
+                            lines.append("    Amazon reviews... no reviews")
+
+                    print("\n".join(lines))
+
+                # Build result
+                result = {
+                    "name": name,
+                    "niche_type": product.get('search_keyword', '')[:20],  # Short keyword
+                    "search_keyword": product.get('search_keyword', ''),
+                    "amazon_url": product.get('url', ''),
+                    "amazon_asin": asin,
+                    "price": product.get('price', 'N/A'),
+                    "amazon_rating": product.get('rating', 0),
+                    "amazon_review_count": product.get('reviews', 0),
+                    "keywords": keywords_extracted,
+                    "trend_score": 70,  # Default for custom keywords
+                    "trend_direction": "custom",
+                }
 
-            # Get Amazon review sentiment (optional - slower but more accurate)
-            amazon_sentiment_data = {}
-            if include_amazon_reviews and asin:
-                print(f"    Amazon reviews...", end=" ")
-                amazon_sentiment_data = self.amazon.get_product_sentiment(
-                    asin,
-                    self.sentiment,
-                    max_reviews=15
-                )
-                if amazon_sentiment_data.get("amazon_reviews_analyzed", 0) > 0:
-                    sent = amazon_sentiment_data["amazon_sentiment"]
-                    label = "+" if sent > 0.05 else "-" if sent < -0.05 else "~"
-                    print(f"{amazon_sentiment_data['amazon_reviews_analyzed']} reviews ({label})")
+                # Add Reddit data
+                result.update(reddit_data)
+
+                # Add Amazon sentiment data if available
+                if amazon_sentiment_data:
+                    result.update(amazon_sentiment_data)
+
+                # Combined sentiment (weight Amazon higher if available)
+                reddit_sent = reddit_data.get("reddit_sentiment", 0)
+                amazon_sent = amazon_sentiment_data.get("amazon_sentiment", 0)
+                if amazon_sent != 0 and reddit_sent != 0:
+                    # 60% Amazon (product-specific), 40% Reddit (community)
+                    result["combined_sentiment"] = amazon_sent * 0.6 + reddit_sent * 0.4
+                elif amazon_sent != 0:
+                    result["combined_sentiment"] = amazon_sent
                 else:
-                    print("no reviews")
-
-            # Build result
-            result = {
-                "name": name,
-                "niche_type": product.get('search_keyword', '')[:20],  # Short keyword
-                "search_keyword": product.get('search_keyword', ''),
-                "amazon_url": product.get('url', ''),
-                "amazon_asin": asin,
-                "price": product.get('price', 'N/A'),
-                "amazon_rating": product.get('rating', 0),
-                "amazon_review_count": product.get('reviews', 0),
-                "keywords": keywords_extracted,
-                "trend_score": 70,  # Default for custom keywords
-                "trend_direction": "custom",
-            }
-
-            # Add Reddit data
-            result.update(reddit_data)
-
-            # Add Amazon sentiment data if available
-            if amazon_sentiment_data:
-                result.update(amazon_sentiment_data)
-
-            # Combined sentiment (weight Amazon higher if available)
-            reddit_sent = reddit_data.get("reddit_sentiment", 0)
-            amazon_sent = amazon_sentiment_data.get("amazon_sentiment", 0)
-            if amazon_sent != 0 and reddit_sent != 0:
-                # 60% Amazon (product-specific), 40% Reddit (community)
-                result["combined_sentiment"] = amazon_sent * 0.6 + reddit_sent * 0.4
-            elif amazon_sent != 0:
-                result["combined_sentiment"] = amazon_sent
-            else:
-                result["combined_sentiment"] = reddit_sent
-
-            # Calculate profit margin estimate
-            profit_data = self._estimate_profit_margin(result.get("price", "0"))
-            result.update(profit_data)
-
-            # Detect seasonality
-            seasonality_data = self._detect_seasonality(name)
-            result.update(seasonality_data)
-
-            # Calculate competition score
-            competition_data = self._calculate_competition_score(
-                result.get("amazon_review_count", 0),
-                result.get("amazon_rating", 0)
-            )
-            result.update(competition_data)
-
-            # Get sourcing data (Alibaba/AliExpress URLs + estimated supplier price)
-            sourcing_data = self._get_sourcing_data(
-                name,
-                profit_data.get("selling_price", 0)
-            )
-            result.update(sourcing_data)
+                    result["combined_sentiment"] = reddit_sent
 
-            # Calculate score
-            result["opportunity_score"] = self._calculate_opportunity_score(result)
+                # Profit, seasonality, competition and sourcing data
+                self._enrich_product(result)
 
-            results.append(result)
+                results.append(result)
 
-        # Sort by score
-        results.sort(key=lambda x: x["opportunity_score"], reverse=True)
+        # Calculate scores in one pass, then sort
+        self._score_products(results)
+        results.sort(key=itemgetter("opportunity_score"), reverse=True)
 
         print("\n" + "=" * 70)
         print(f"Found {len(results)} products")
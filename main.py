@@ -7,16 +7,33 @@ Product Research Bot - NEW PIPELINE
 """
 
 import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
-from scrapers import AmazonScraper, TrendsScraper, RedditScraper, get_amazon_trending
-from analysis import SentimentAnalyzer, ProductScorer
+import numpy as np
+
+from scrapers import AmazonScraper, TrendsScraper, RedditScraper, create_http_session, get_amazon_trending
+from scrapers.base_scraper import cache_key, query_key
+from analysis import SentimentAnalyzer, ProductScorer, aggregate_sentiment
 from reports import ReportGenerator
 from discovery import TrendsToProductsFinder
+from discovery.reddit_sentiment import empty_reddit_sentiment, summarize_sentiment
 from database import Database
 import json
 
+# Worker threads for the pipeline's sentiment step (requests are still
+# spaced by the shared Reddit rate limit, see BaseScraper.rate_limit)
+REDDIT_WORKERS = 5
+
+# Size/quantity info and parenthesized text, dropped from Reddit search queries
+_QUERY_STRIP_RE = re.compile(
+    r'\d+\s*(?:oz|ml|inch|pack|count|lb|kg|piece|set)\b|\([^)]*\)',
+    re.IGNORECASE
+)
+
 
 class ProductResearchBot:
     """
@@ -27,7 +44,8 @@ class ProductResearchBot:
     def __init__(self):
         self.amazon = AmazonScraper(delay=3.0)
         self.trends = TrendsScraper(delay=2.0)
-        self.reddit = RedditScraper(delay=2.0)
+        # Keep-alive pooled session, reused by every (concurrent) Reddit search
+        self.reddit = RedditScraper(delay=2.0, session=create_http_session())
         self.sentiment = SentimentAnalyzer()
         self.scorer = ProductScorer()
         self.reporter = ReportGenerator()
@@ -49,10 +67,10 @@ class ProductResearchBot:
         if categories is None:
             categories = ["kitchen", "fitness", "home"]
 
-        # STEP 1: Find trending products on Amazon (using browser automation)
+        # STEP 1: Find trending products on Amazon (plain HTTP, browser as fallback)
         print("\n[STEP 1] Finding trending products on Amazon...")
         print("-" * 50)
-        print("  Using browser automation (Playwright)...")
+        print("  Fetching pages directly, falling back to browser automation (Playwright)...")
 
         trending_products = get_amazon_trending(categories, limit_per_category=limit)
 
@@ -94,128 +112,136 @@ class ProductResearchBot:
         print("=" * 70 + "\n")
 
     def _check_trends(self, products: List[Dict]) -> List[Dict]:
-        """Check Google Trends for each product."""
-        for i, product in enumerate(products):
+        """
+        Check Google Trends for each product.
+
+        Lookups run one at a time on the shared Trends client (Google Trends
+        returns 429s under load), once per distinct name.
+        """
+        # Normalized name -> (name to look up, products sharing it)
+        groups: Dict[str, Tuple[str, List[Dict]]] = {}
+        for product in products:
             name = product.get("name", "")[:50]
-            print(f"  [{i+1}/{len(products)}] Checking: {name}...", end=" ")
+            groups.setdefault(cache_key(name), (name, []))[1].append(product)
 
+        for i, (name, group) in enumerate(groups.values()):
             trend_data = self.trends.check_trend(name)
-            product["trend_score"] = trend_data.get("trend_score", 50)
-            product["trend_direction"] = trend_data.get("trend_direction", "unknown")
-            product["trend_recent"] = trend_data.get("recent_interest", 0)
+            trend_fields = {
+                "trend_score": trend_data.get("trend_score", 50),
+                "trend_direction": trend_data.get("trend_direction", "unknown"),
+                "trend_recent": trend_data.get("recent_interest", 0),
+            }
+            for product in group:
+                product.update(trend_fields)
 
-            print(f"{product['trend_direction']} ({product['trend_score']})")
+            # One write per product instead of a half line left waiting on the request
+            print(f"  [{i+1}/{len(groups)}] Checking: {name}... "
+                  f"{trend_fields['trend_direction']} ({trend_fields['trend_score']})")
 
         return products
 
-    def _get_reddit_sentiment(self, products: List[Dict]) -> List[Dict]:
-        """Search Reddit for each product and analyze sentiment."""
-        for i, product in enumerate(products):
-            name = product.get("name", "")
-            # Use shorter search query
-            search_query = self._make_search_query(name)
-
-            print(f"  [{i+1}/{len(products)}] Searching: {search_query[:40]}...", end=" ")
-
-            # Search Reddit
-            posts = self.reddit.search_all_reddit(search_query, limit=20)
-
-            if posts:
-                # Analyze sentiment of all posts
-                sentiments = []
-                for post in posts:
-                    text = f"{post.get('title', '')} {post.get('content', '')}"
-                    label, score = self.sentiment.get_sentiment_label(text)
-                    sentiments.append({
-                        "label": label,
-                        "score": score,
-                        "upvotes": post.get("upvotes", 0),
-                    })
-
-                # Calculate weighted sentiment (upvotes matter)
-                total_weight = sum(max(s["upvotes"], 1) for s in sentiments)
-                weighted_sentiment = sum(
-                    s["score"] * max(s["upvotes"], 1) for s in sentiments
-                ) / total_weight if total_weight > 0 else 0
-
-                positive_count = sum(1 for s in sentiments if s["label"] == "positive")
-                negative_count = sum(1 for s in sentiments if s["label"] == "negative")
-
-                product["reddit_posts"] = len(posts)
-                product["reddit_sentiment"] = round(weighted_sentiment, 3)
-                product["reddit_positive"] = positive_count
-                product["reddit_negative"] = negative_count
-                product["sentiment_ratio"] = round(
-                    positive_count / max(positive_count + negative_count, 1), 2
-                )
+    def _get_reddit_sentiment(self, products: List[Dict], max_workers: int = REDDIT_WORKERS) -> List[Dict]:
+        """
+        Search Reddit for each product and analyze sentiment.
 
-                sentiment_label = "positive" if weighted_sentiment > 0.05 else "negative" if weighted_sentiment < -0.05 else "neutral"
-                print(f"{len(posts)} posts, {sentiment_label} ({weighted_sentiment:.2f})")
-            else:
-                product["reddit_posts"] = 0
-                product["reddit_sentiment"] = 0
-                product["reddit_positive"] = 0
-                product["reddit_negative"] = 0
-                product["sentiment_ratio"] = 0.5
-                print("no posts found")
+        Products that reduce to the same search query share one search.
+        Searches are spread over a thread pool, but their requests still
+        leave one interval apart through RedditScraper's shared per-host rate
+        limit; the pool only overlaps response handling and sentiment scoring.
+        """
+        # Normalized query -> (query to search, products sharing it); keyed like
+        # the scraper's own search cache, so case/spacing variants share a search
+        groups: Dict[str, Tuple[str, List[Dict]]] = {}
+        for product in products:
+            query = self._make_search_query(product.get("name", ""))
+            groups.setdefault(query_key(query), (query, []))[1].append(product)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._search_reddit_sentiment, query): group
+                for query, group in groups.values()
+            }
+
+            for i, future in enumerate(as_completed(futures)):
+                sentiment_data, message = future.result()
+                for product in futures[future]:
+                    product.update(sentiment_data)
+                print(f"  [{i+1}/{len(futures)}] {message}")
 
         return products
 
-    def _make_search_query(self, product_name: str) -> str:
-        """Create a good search query from product name."""
-        import re
-        # Remove size/quantity info
-        query = re.sub(r'\d+\s*(oz|ml|inch|pack|count|lb|kg|piece|set)\b', '', product_name, flags=re.IGNORECASE)
-        # Remove parentheses content
-        query = re.sub(r'\([^)]*\)', '', query)
-        # Clean up
-        query = re.sub(r'\s+', ' ', query).strip()
-        # Take first few meaningful words
-        words = query.split()[:4]
-        return ' '.join(words)
+    def _search_reddit_sentiment(self, search_query: str) -> Tuple[Dict[str, Any], str]:
+        """Reddit sentiment fields for one search query (runs in a worker thread), plus a log line."""
+        # Search Reddit
+        posts = self.reddit.search_all_reddit(search_query, limit=20)
+
+        if not posts:
+            return empty_reddit_sentiment(), f"Searched: {search_query[:40]}... no posts found"
+
+        # Analyze sentiment of all posts in one batch call
+        texts = [f"{post.get('title', '')} {post.get('content', '')}" for post in posts]
+        labeled = self.sentiment.get_sentiment_labels_batch(texts)
+        weights = [max(post.get("upvotes", 0), 1) for post in posts]
+
+        # Weighted sentiment (upvotes matter) and label counts
+        sentiment_data = summarize_sentiment(labeled, weights, len(posts))
+        weighted_sentiment = sentiment_data["reddit_sentiment"]
+
+        sentiment_label = "positive" if weighted_sentiment > 0.05 else "negative" if weighted_sentiment < -0.05 else "neutral"
+        return sentiment_data, f"Searched: {search_query[:40]}... {len(posts)} posts, {sentiment_label} ({weighted_sentiment:.2f})"
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _make_search_query(product_name: str) -> str:
+        """Create a good search query from product name (cached per name)."""
+        # Remove size/quantity info and parentheses content in one pass
+        query = _QUERY_STRIP_RE.sub('', product_name)
+        # Take first few meaningful words (split also collapses whitespace)
+        return ' '.join(query.split(maxsplit=4)[:4])
 
     def _calculate_scores(self, products: List[Dict]) -> List[Dict]:
-        """Calculate final opportunity score for each product."""
-        for product in products:
-            # Components of the score:
-            # 1. Amazon trend (it's on Movers & Shakers) = base 30 points
-            # 2. Google Trends score (0-100) = up to 25 points
-            # 3. Reddit sentiment (-1 to 1) = up to 25 points
-            # 4. Reddit discussion volume = up to 20 points
+        """Calculate final opportunity score for each product, in one vectorized pass."""
+        if not products:
+            return products
 
-            base_score = 30  # On Amazon trending = good sign
+        n = len(products)
 
-            # Google Trends component
-            trend_score = product.get("trend_score", 50)
-            trend_component = (trend_score / 100) * 25
+        def column(key: str, default: float) -> np.ndarray:
+            return np.fromiter((p.get(key, default) for p in products), dtype=np.float64, count=n)
 
-            # Reddit sentiment component
-            reddit_sentiment = product.get("reddit_sentiment", 0)
-            # Convert -1 to 1 range to 0 to 25
-            sentiment_component = ((reddit_sentiment + 1) / 2) * 25
+        # Components of the score:
+        # 1. Amazon trend (it's on Movers & Shakers) = base 30 points
+        # 2. Google Trends score (0-100) = up to 25 points
+        # 3. Reddit sentiment (-1 to 1) = up to 25 points
+        # 4. Reddit discussion volume = up to 20 points
 
-            # Reddit volume component (log scale)
-            reddit_posts = product.get("reddit_posts", 0)
-            import math
-            volume_component = min(20, math.log10(reddit_posts + 1) * 10)
+        base_score = 30  # On Amazon trending = good sign
 
-            # Final score
-            final_score = base_score + trend_component + sentiment_component + volume_component
+        # Google Trends component
+        trend_component = column("trend_score", 50) / 100 * 25
 
-            # Bonus for positive sentiment ratio
-            if product.get("sentiment_ratio", 0.5) > 0.7:
-                final_score += 5
+        # Reddit sentiment component
+        # Convert -1 to 1 range to 0 to 25
+        sentiment_component = (column("reddit_sentiment", 0) + 1) / 2 * 25
 
-            # Penalty for negative sentiment
-            if product.get("reddit_negative", 0) > product.get("reddit_positive", 0):
-                final_score -= 10
+        # Reddit volume component (log scale)
+        volume_component = np.minimum(20, np.log10(column("reddit_posts", 0) + 1) * 10)
 
-            product["opportunity_score"] = round(min(100, max(0, final_score)), 1)
+        # Final score
+        final_scores = base_score + trend_component + sentiment_component + volume_component
 
-        # Sort by score
-        products.sort(key=lambda x: x.get("opportunity_score", 0), reverse=True)
+        # Bonus for positive sentiment ratio
+        final_scores += np.where(column("sentiment_ratio", 0.5) > 0.7, 5, 0)
 
-        return products
+        # Penalty for negative sentiment
+        final_scores -= np.where(column("reddit_negative", 0) > column("reddit_positive", 0), 10, 0)
+
+        final_scores = np.round(np.clip(final_scores, 0, 100), 1)
+        for product, score in zip(products, final_scores.tolist()):
+            product["opportunity_score"] = score
+
+        # Sort by score (stable, so ties keep their order)
+        return [products[i] for i in np.argsort(-final_scores, kind="stable").tolist()]
 
     def _generate_report(self, products: List[Dict]):
         """Generate and display the final report."""
@@ -223,7 +249,8 @@ class ProductResearchBot:
         print("TOP PRODUCT OPPORTUNITIES")
         print("=" * 70)
 
-        # Display top 20
+        # Display top 20 (rows are collected and printed in one write)
+        rows = []
         for i, product in enumerate(products[:20], 1):
             name = product.get("name", "Unknown")[:45]
             score = product.get("opportunity_score", 0)
@@ -234,7 +261,10 @@ class ProductResearchBot:
 
             sent_emoji = "+" if sentiment > 0.05 else "-" if sentiment < -0.05 else "~"
 
-            print(f"{i:2}. [{score:5.1f}] {name:45} | {category:8} | T:{trend} S:{sent_emoji} R:{posts:2}")
+            rows.append(f"{i:2}. [{score:5.1f}] {name:45} | {category:8} | T:{trend} S:{sent_emoji} R:{posts:2}")
+
+        if rows:
+            print("\n".join(rows))
 
         print("\nLegend: T=Trend(R/S/F/U), S=Sentiment(+/-/~), R=Reddit posts")
 
@@ -317,15 +347,10 @@ class ProductResearchBot:
         print(f"   Posts found: {len(posts)}")
 
         if posts:
-            sentiments = []
-            for post in posts:
-                text = f"{post.get('title', '')} {post.get('content', '')}"
-                label, score = self.sentiment.get_sentiment_label(text)
-                sentiments.append({"label": label, "score": score})
-
-            avg_sentiment = sum(s["score"] for s in sentiments) / len(sentiments)
-            positive = sum(1 for s in sentiments if s["label"] == "positive")
-            negative = sum(1 for s in sentiments if s["label"] == "negative")
+            # Score every post in one batch call; equal weights give the plain average
+            texts = [f"{post.get('title', '')} {post.get('content', '')}" for post in posts]
+            labeled = self.sentiment.get_sentiment_labels_batch(texts)
+            avg_sentiment, positive, negative = aggregate_sentiment(labeled, [1] * len(labeled))
 
             print(f"   Avg Sentiment: {avg_sentiment:.2f}")
             print(f"   Positive: {positive}, Negative: {negative}")
@@ -435,10 +460,12 @@ def show_recent_runs(limit: int = 20):
     print(f"{'ID':<6} {'Timestamp':<20} {'Mode':<18} {'Products':<10} {'Avg Score':<10} {'Duration'}")
     print("-" * 80)
 
+    rows = []
     for run in runs:
         timestamp = run.run_timestamp.strftime("%Y-%m-%d %H:%M") if run.run_timestamp else "N/A"
         duration = f"{run.duration_seconds}s" if run.duration_seconds else "N/A"
-        print(f"{run.id:<6} {timestamp:<20} {run.mode:<18} {run.products_found:<10} {run.avg_score:<10.1f} {duration}")
+        rows.append(f"{run.id:<6} {timestamp:<20} {run.mode:<18} {run.products_found:<10} {run.avg_score:<10.1f} {duration}")
+    print("\n".join(rows))
 
     print("-" * 80)
     print(f"Total: {len(runs)} runs")
@@ -468,6 +495,12 @@ def show_product_history(query: str):
         print(f"  Score Range: {product.lowest_score:.1f} - {product.highest_score:.1f}")
         print(f"  Current Score: {product.opportunity_score:.1f}")
 
+        metrics = db.get_product_metrics(product.id)
+        if metrics:
+            print("\n  Metrics:")
+            for m in metrics:
+                print(f"    [{m.period:>3}] Avg: {m.avg_score:.1f} | P95: {m.p95_score:.1f} | Trend: {m.trend_slope:+.2f}/run")
+
         # Get recent snapshots
         history = db.get_product_history(product.id, limit=5)
         if history:
@@ -507,9 +540,11 @@ def show_run_details(run_id: int):
         print(f"{'#':<4} {'Score':<8} {'Sentiment':<12} {'Product Name'}")
         print("-" * 80)
 
+        rows = []
         for i, snap in enumerate(snapshots[:30], 1):
             sent_label = "+" if snap.reddit_sentiment > 0.05 else "-" if snap.reddit_sentiment < -0.05 else "~"
-            print(f"{i:<4} {snap.opportunity_score:<8.1f} {sent_label}{abs(snap.reddit_sentiment):<10.2f} {snap.product.name[:55]}")
+            rows.append(f"{i:<4} {snap.opportunity_score:<8.1f} {sent_label}{abs(snap.reddit_sentiment):<10.2f} {snap.product.name[:55]}")
+        print("\n".join(rows))
 
 
 def compare_discovery_runs(run_id_1: int, run_id_2: int):
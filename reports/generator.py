@@ -10,6 +10,13 @@ from typing import List, Dict, Optional
 from tabulate import tabulate
 
 
+def _json_default(obj):
+    """Convert values json can't encode natively (datetimes) to strings."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class ReportGenerator:
     """Generate reports from product research data."""
 
@@ -137,12 +144,8 @@ class ReportGenerator:
             writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
             writer.writeheader()
 
-            for product in products:
-                # Convert list fields to strings
-                row = product.copy()
-                if isinstance(row.get('keywords'), list):
-                    row['keywords'] = ', '.join(row['keywords'])
-                writer.writerow(row)
+            # Rows are written straight from the product dicts; extra keys are ignored
+            writer.writerows(products)
 
         print(f"CSV exported to: {filepath}")
         return filepath
@@ -163,20 +166,9 @@ class ReportGenerator:
 
         filepath = os.path.join(self.output_dir, f"{filename}.json")
 
-        def serialize(obj):
-            """Recursively convert datetime objects to strings."""
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            elif isinstance(obj, dict):
-                return {k: serialize(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [serialize(item) for item in obj]
-            return obj
-
-        serializable = serialize(products)
-
+        # Streams straight to the file; datetimes are converted as they are reached
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(serializable, f, indent=2)
+            json.dump(products, f, indent=2, default=_json_default)
 
         print(f"JSON exported to: {filepath}")
         return filepath
@@ -1,3 +1,5 @@
+from .base_scraper import create_http_session
+from .disk_cache import DiskCache
 from .reddit_scraper import RedditScraper
 from .amazon_scraper import AmazonScraper
 from .trends_scraper import TrendsScraper
@@ -5,7 +5,9 @@ Finds actual products on Amazon related to trending topics
 
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
+import threading
 import time
 import re
 
@@ -13,10 +15,30 @@ import re
 class AmazonProductFinder:
     """Find products on Amazon related to trending keywords."""
 
+    # Earliest time the next Amazon request may start, shared by every
+    # finder instance and thread (see _wait_for_slot)
+    _next_request_at = 0.0
+    _slot_lock = threading.Lock()
+
     def __init__(self, delay: float = 2.0):
         self.delay = delay
         self.base_url = "https://www.amazon.com"
 
+    def _wait_for_slot(self):
+        """
+        Block until this caller's request slot on amazon.com comes up.
+
+        Slots are reserved one delay apart under a class-wide lock, so
+        parallel searches queue up instead of sleeping side by side and
+        firing together.
+        """
+        with AmazonProductFinder._slot_lock:
+            now = time.monotonic()
+            slot = max(now, AmazonProductFinder._next_request_at)
+            AmazonProductFinder._next_request_at = slot + self.delay
+
+        time.sleep(slot - now)
+
     def find_products_for_topic(self, topic: str, max_products: int = 5) -> List[Dict[str, Any]]:
         """
         Find products on Amazon related to a trending topic.
@@ -42,6 +64,7 @@ class AmazonProductFinder:
                 "Upgrade-Insecure-Requests": "1"
             }
 
+            self._wait_for_slot()
             response = requests.get(search_url, headers=headers, timeout=10)
             response.raise_for_status()
 
@@ -109,8 +132,6 @@ class AmazonProductFinder:
                 except Exception as e:
                     continue
 
-            time.sleep(self.delay)
-
             return products
 
         except Exception as e:
@@ -121,15 +142,21 @@ class AmazonProductFinder:
         self,
         topics: List[str],
         products_per_topic: int = 3,
-        progress_callback=None
+        progress_callback=None,
+        max_concurrency: int = 5
     ) -> List[Dict[str, Any]]:
         """
         Find products for multiple trending topics.
 
+        Topics are searched in parallel, but request starts stay one delay
+        apart (see _wait_for_slot); results are merged in topic order so
+        output matches a sequential run.
+
         Args:
             topics: List of trending topics
             products_per_topic: Max products per topic
             progress_callback: Progress update function
+            max_concurrency: Max Amazon searches in flight at once
 
         Returns:
             List of all products found
@@ -137,22 +164,30 @@ class AmazonProductFinder:
         all_products = []
         seen_names = set()
 
-        for i, topic in enumerate(topics):
-            if progress_callback:
-                progress_callback(i, len(topics), topic)
+        if not topics:
+            return all_products
+
+        workers = max(1, min(max_concurrency, len(topics)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda topic: self.find_products_for_topic(topic, products_per_topic),
+                topics
+            )
 
-            print(f"\n  [{i+1}/{len(topics)}] Finding products for: {topic}")
+            for i, (topic, products) in enumerate(zip(topics, results)):
+                if progress_callback:
+                    progress_callback(i, len(topics), topic)
 
-            products = self.find_products_for_topic(topic, products_per_topic)
+                print(f"\n  [{i+1}/{len(topics)}] Finding products for: {topic}")
 
-            # Deduplicate by product name
-            for product in products:
-                name_lower = product['name'].lower()
+                # Deduplicate by product name
+                for product in products:
+                    name_lower = product['name'].lower()
 
-                # Check if we've seen this product
-                if name_lower not in seen_names:
-                    all_products.append(product)
-                    seen_names.add(name_lower)
-                    print(f"    + {product['name'][:60]}")
+                    # Check if we've seen this product
+                    if name_lower not in seen_names:
+                        all_products.append(product)
+                        seen_names.add(name_lower)
+                        print(f"    + {product['name'][:60]}")
 
         return all_products
@@ -10,7 +10,7 @@ import time
 from typing import Dict, List, Any, Optional
 
 from .reddit_scraper import RedditScraper
-from analysis import SentimentAnalyzer
+from analysis import SentimentAnalyzer, aggregate_sentiment
 
 
 class AsyncRedditScraper:
@@ -198,31 +198,22 @@ class AsyncRedditScraper:
         if not posts:
             return self._empty_sentiment_result()
 
-        sentiments = []
+        # Skip empty posts, then label the rest in one batch call
+        texts = []
+        upvotes = []
         for post in posts:
             text = f"{post.get('title', '')} {post.get('content', '')}"
-            if not text.strip():
-                continue
+            if text.strip():
+                texts.append(text)
+                upvotes.append(max(post.get("upvotes", 0), 1))
 
-            label, score = self.sentiment_analyzer.get_sentiment_label(text)
-            sentiments.append({
-                "label": label,
-                "score": score,
-                "upvotes": max(post.get("upvotes", 0), 1),
-            })
-
-        if not sentiments:
+        if not texts:
             return self._empty_sentiment_result()
 
         # Weighted sentiment by upvotes
-        total_weight = sum(s["upvotes"] for s in sentiments)
-        weighted_sentiment = sum(
-            s["score"] * s["upvotes"] for s in sentiments
-        ) / total_weight if total_weight > 0 else 0
-
-        positive_count = sum(1 for s in sentiments if s["label"] == "positive")
-        negative_count = sum(1 for s in sentiments if s["label"] == "negative")
-        neutral_count = sum(1 for s in sentiments if s["label"] == "neutral")
+        labeled = self.sentiment_analyzer.get_sentiment_labels_batch(texts)
+        weighted_sentiment, positive_count, negative_count = aggregate_sentiment(labeled, upvotes)
+        neutral_count = len(labeled) - positive_count - negative_count
 
         return {
             "reddit_posts": len(posts),
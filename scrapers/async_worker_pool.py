@@ -19,6 +19,7 @@ class AsyncWorkerPool:
     - Rate limiting with configurable delays
     - Progress callback support for UI updates
     - Graceful error handling per task
+    - Structured cancellation (asyncio.TaskGroup) so no task outlives a batch
 
     Usage:
         pool = AsyncWorkerPool(max_workers=3, delay_between_tasks=10.0)
@@ -28,6 +29,7 @@ class AsyncWorkerPool:
 
         tasks = [fetch_data(item) for item in items]
         results = await pool.execute_batch(tasks)
+        ok = [r for r in results if not isinstance(r, Exception)]
     """
 
     def __init__(
@@ -69,7 +71,8 @@ class AsyncWorkerPool:
             progress_callback: Optional callback(completed, total, message)
 
         Returns:
-            List of results in same order as input coroutines
+            List of results in same order as input coroutines; a failed
+            task's slot holds its exception (like gather's return_exceptions)
         """
         total = len(coroutines)
         self.completed_count = 0
@@ -98,19 +101,19 @@ class AsyncWorkerPool:
                     self.error_count += 1
                     print(f"    Task {index + 1} failed: {str(e)[:100]}")
 
-                    # Return error dict instead of raising
-                    return {"error": str(e), "task_index": index}
+                    # Return the exception instead of raising
+                    return e
 
-        # Create wrapped tasks
-        tasks = [
-            wrapped_task(coro, i)
-            for i, coro in enumerate(coroutines)
-        ]
+        # Execute all tasks concurrently (bounded by semaphore). The TaskGroup
+        # cancels every sibling if one escapes with a non-Exception error or the
+        # batch itself is cancelled, so no task outlives the batch.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(wrapped_task(coro, i))
+                for i, coro in enumerate(coroutines)
+            ]
 
-        # Execute all tasks concurrently (bounded by semaphore)
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-
-        return results
+        return [task.result() for task in tasks]
 
     async def _apply_delay(self):
         """Apply rate limiting delay between requests."""
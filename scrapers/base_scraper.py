@@ -6,12 +6,69 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 import time
 import random
+import re
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from fake_useragent import UserAgent
 
+_KEY_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+def cache_key(query: str) -> str:
+    """
+    Normalize a query into a lookup-cache key.
+
+    Lowercases, strips punctuation and sorts tokens so that
+    "blue light glasses" and "Light-Blue glasses" share an entry. Only for
+    plain keyword lookups (Trends, product names), not search syntax.
+    """
+    return ' '.join(sorted(_KEY_PUNCT_RE.sub(' ', query.lower()).split()))
+
+
+def query_key(query: str) -> str:
+    """
+    Normalize a search query into a lookup-cache key.
+
+    Only case and whitespace are normalized: unlike cache_key, operators,
+    quotes and grouping are kept, so "(a b) OR (c)" and "(a) OR (b c)"
+    stay distinct. Use this for search syntax, cache_key for plain keywords.
+    """
+    return ' '.join(query.lower().split())
+
+
+def create_http_session(pool_connections: int = 20, pool_maxsize: int = 50) -> requests.Session:
+    """
+    Create a keep-alive session with connection pooling, meant to be shared
+    by several scrapers so TCP/TLS connections are reused across calls.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Max connections kept open per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.5)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
 
+    # Time of the latest reserved request slot per host, shared by every
+    # scraper instance and thread (see rate_limit)
+    _last_request_at: Dict[str, float] = {}
+    _rate_limit_lock = threading.Lock()
+
     def __init__(self, delay: float = 25.0):  # Increased from 2.0 to 25.0
         self.delay = delay
         self.session_count = 0
@@ -49,16 +106,31 @@ class BaseScraper(ABC):
             }
 
     def rate_limit(self):
-        """Apply rate limiting between requests with jitter."""
+        """
+        Apply rate limiting between requests with jitter.
+
+        Slots are reserved per host under a lock shared by all scrapers and
+        threads, so concurrent callers queue up one interval apart instead of
+        sleeping side by side and firing together. A lone caller waits the
+        same as before: the interval, counted from when it asks.
+        """
         # Add jitter to avoid patterns
         jitter = random.uniform(-2.0, 2.0)
-        sleep_time = max(15.0, self.delay + jitter)  # Minimum 15 seconds
-        time.sleep(sleep_time)
-        self.session_count += 1
+        interval = max(15.0, self.delay + jitter)  # Minimum 15 seconds
+        host = getattr(self, "BASE_URL", type(self).__name__)
+
+        with BaseScraper._rate_limit_lock:
+            now = time.monotonic()
+            slot = max(now, BaseScraper._last_request_at.get(host, now)) + interval
+            BaseScraper._last_request_at[host] = slot
+            self.session_count += 1
+            count = self.session_count
+
+        time.sleep(slot - now)
 
         # Log every 10 requests for monitoring
-        if self.session_count % 10 == 0:
-            print(f"    [{self.session_count} requests completed]")
+        if count % 10 == 0:
+            print(f"    [{count} requests completed]")
 
     @abstractmethod
     def scrape(self, target: str, **kwargs) -> List[Dict[str, Any]]:
@@ -7,13 +7,31 @@ Includes stealth configuration to avoid detection.
 import asyncio
 import re
 import random
+import threading
 import time
 from typing import List, Dict, Any
 from datetime import datetime
 
+from analysis import aggregate_sentiment
+from .amazon_scraper import AmazonScraper
 from .stealth_config import UserAgentRotator, StealthConfig
 from .rate_limiter import RateLimiter
 
+# Runs of anything that isn't part of a number ("$", ",", "USD ")
+_PRICE_CLEAN_RE = re.compile(r'[^\d.]+')
+
+# Badge/label texts that can sit where a search result's title is expected
+_BADGE_RE = re.compile(
+    '|'.join(map(re.escape, [
+        "amazon's choice",
+        "overall pick",
+        "best seller",
+        "limited time deal",
+        "climate pledge",
+    ])),
+    re.IGNORECASE
+)
+
 
 def parse_price(price_str: str) -> float:
     """
@@ -24,7 +42,7 @@ def parse_price(price_str: str) -> float:
         return 0.0
     try:
         # Remove currency symbols and commas
-        clean = re.sub(r'[^\d.]', '', price_str)
+        clean = _PRICE_CLEAN_RE.sub('', price_str)
         return float(clean) if clean else 0.0
     except (ValueError, TypeError):
         return 0.0
@@ -54,8 +72,58 @@ class BrowserScraper:
             jitter=5.0
         )
 
+        # Warm-browser session (see open_session): a private event loop thread
+        # that keeps one browser/context alive across sync calls
+        self._loop = None
+        self._loop_thread = None
+        self._run_lock = threading.Lock()
+
+    def open_session(self):
+        """
+        Keep one browser open across calls until close_session().
+
+        Playwright objects are bound to the event loop that created them, so the
+        sync wrappers run on a dedicated loop thread instead of asyncio.run().
+        Saves a Chromium launch + context setup per search/review scrape.
+        """
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+    def close_session(self):
+        """Close the warm browser and stop the session loop."""
+        if self._loop is None:
+            return
+        loop, self._loop = self._loop, None
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown_browser(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop_thread.join()
+            loop.close()
+            self._loop_thread = None
+
+    def __enter__(self):
+        self.open_session()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_session()
+
+    def _run(self, coro):
+        """Run a coroutine to completion from sync code (on the session loop if open)."""
+        if self._loop is None:
+            return asyncio.run(coro)
+        # One page is shared, so calls from several threads take turns
+        with self._run_lock:
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
     async def _init_browser(self):
-        """Initialize the browser with stealth settings."""
+        """Initialize the browser with stealth settings (reused within a session)."""
+        if self._loop is not None and self.page is not None:
+            return True
         try:
             from playwright.async_api import async_playwright
 
@@ -109,11 +177,18 @@ class BrowserScraper:
         return True
 
     async def _close_browser(self):
-        """Close the browser."""
+        """Close the browser (kept open while a session is active)."""
+        if self._loop is None:
+            await self._shutdown_browser()
+
+    async def _shutdown_browser(self):
+        """Close the browser and stop Playwright."""
         if self.browser:
             await self.browser.close()
         if hasattr(self, 'playwright'):
             await self.playwright.stop()
+            del self.playwright
+        self.browser = self.context = self.page = None
 
     async def scrape_amazon_movers_shakers(self, category: str = "kitchen", limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -237,7 +312,7 @@ class BrowserScraper:
         Synchronous wrapper for async scraping.
         Use this from non-async code.
         """
-        return asyncio.run(self.scrape_amazon_movers_shakers(category, limit))
+        return self._run(self.scrape_amazon_movers_shakers(category, limit))
 
     async def search_amazon_products(self, keyword: str, max_products: int = 5) -> List[Dict[str, Any]]:
         """
@@ -305,15 +380,8 @@ class BrowserScraper:
                             candidate = await name_elem.inner_text()
                             candidate = candidate.strip() if candidate else ""
                             # Skip badges, short names, and generic labels
-                            skip_patterns = [
-                                "amazon's choice",
-                                "overall pick",
-                                "best seller",
-                                "limited time deal",
-                                "climate pledge",
-                            ]
                             if candidate and len(candidate) > 10:
-                                if not any(p in candidate.lower() for p in skip_patterns):
+                                if not _BADGE_RE.search(candidate):
                                     name = candidate
                                     break
 
@@ -452,7 +520,7 @@ class BrowserScraper:
         Synchronous wrapper for Amazon search.
         Use this from non-async code.
         """
-        return asyncio.run(self.search_amazon_products(keyword, max_products))
+        return self._run(self.search_amazon_products(keyword, max_products))
 
     async def scrape_product_reviews(self, asin: str, max_reviews: int = 20) -> List[Dict[str, Any]]:
         """
@@ -569,7 +637,7 @@ class BrowserScraper:
         """
         Synchronous wrapper for review scraping.
         """
-        return asyncio.run(self.scrape_product_reviews(asin, max_reviews))
+        return self._run(self.scrape_product_reviews(asin, max_reviews))
 
     def get_product_sentiment(self, asin: str, sentiment_analyzer, max_reviews: int = 15) -> Dict[str, Any]:
         """
@@ -595,35 +663,17 @@ class BrowserScraper:
                 "amazon_sentiment_ratio": 0.5,
             }
 
-        # Analyze sentiment for each review
-        sentiments = []
-        total_rating = 0
-
-        for review in reviews:
-            # Combine title and text for better analysis
-            full_text = f"{review.get('title', '')} {review.get('text', '')}"
-            label, score = sentiment_analyzer.get_sentiment_label(full_text)
-
-            # Weight by helpful votes (more helpful = more reliable)
-            weight = max(review.get('helpful_votes', 0), 1)
-
-            sentiments.append({
-                "label": label,
-                "score": score,
-                "weight": weight,
-                "rating": review.get('rating', 0),
-            })
+        # Analyze sentiment for all reviews in one batch call
+        # (title + text combined for better analysis)
+        labeled = sentiment_analyzer.get_sentiment_labels_batch([
+            f"{review.get('title', '')} {review.get('text', '')}" for review in reviews
+        ])
 
-            total_rating += review.get('rating', 0)
+        # Weight by helpful votes (more helpful = more reliable)
+        weights = [max(review.get('helpful_votes', 0), 1) for review in reviews]
+        weighted_sentiment, positive_count, negative_count = aggregate_sentiment(labeled, weights)
 
-        # Calculate weighted sentiment
-        total_weight = sum(s["weight"] for s in sentiments)
-        weighted_sentiment = sum(
-            s["score"] * s["weight"] for s in sentiments
-        ) / total_weight if total_weight > 0 else 0
-
-        positive_count = sum(1 for s in sentiments if s["label"] == "positive")
-        negative_count = sum(1 for s in sentiments if s["label"] == "negative")
+        total_rating = sum(review.get('rating', 0) for review in reviews)
 
         return {
             "amazon_sentiment": round(weighted_sentiment, 3),
@@ -701,13 +751,22 @@ class BrowserScraper:
         return all_products
 
 
-def get_amazon_trending(categories: List[str] = None, limit_per_category: int = 10) -> List[Dict[str, Any]]:
+def get_amazon_trending(
+    categories: List[str] = None,
+    limit_per_category: int = 10,
+    use_http: bool = True
+) -> List[Dict[str, Any]]:
     """
     Get trending products from Amazon across multiple categories.
 
+    Each category is first fetched as plain HTML (no browser start or page
+    render); the Playwright scraper is only used for categories where that
+    comes back empty (blocked, CAPTCHA or changed markup).
+
     Args:
         categories: List of categories (default: kitchen, fitness, home)
         limit_per_category: Products per category
+        use_http: Try the HTTP scraper before the browser
 
     Returns:
         Combined list of trending products
@@ -715,12 +774,18 @@ def get_amazon_trending(categories: List[str] = None, limit_per_category: int =
     if categories is None:
         categories = ["kitchen", "fitness", "home"]
 
-    scraper = BrowserScraper()
+    http_scraper = AmazonScraper() if use_http else None
     all_products = []
 
-    for category in categories:
-        products = scraper.scrape_amazon_sync(category, limit_per_category)
-        all_products.extend(products)
+    # One warm browser for every fallback category (launched on first use)
+    with BrowserScraper() as scraper:
+        for category in categories:
+            products = http_scraper.scrape_movers_shakers(category, limit_per_category) if http_scraper else []
+            if products:
+                print(f"  Found {len(products)} products ({category}, HTTP)")
+            else:
+                products = scraper.scrape_amazon_sync(category, limit_per_category)
+            all_products.extend(products)
 
     return all_products
 
@@ -8,6 +8,11 @@ from typing import Dict, Any
 from playwright.async_api import async_playwright
 import re
 
+from .base_scraper import cache_key
+
+# Competition results keyed by normalized product name (process lifetime)
+_competition_cache: Dict[str, Dict[str, Any]] = {}
+
 
 class AmazonCompetitionChecker:
     """Check Amazon competition levels for products."""
@@ -111,6 +116,15 @@ class AmazonCompetitionChecker:
 
 
 def check_amazon_competition(product_name: str) -> Dict[str, Any]:
-    """Synchronous wrapper for async competition check."""
+    """Synchronous wrapper for async competition check (cached per product)."""
+    key = cache_key(product_name)
+    cached = _competition_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
     checker = AmazonCompetitionChecker()
-    return asyncio.run(checker.check_competition(product_name))
+    result = asyncio.run(checker.check_competition(product_name))
+    if "error" not in result:
+        _competition_cache[key] = result
+        return dict(result)
+    return result
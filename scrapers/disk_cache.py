@@ -0,0 +1,83 @@
+"""
+Small persistent key/value cache backed by SQLite.
+
+Lets scrapers keep results across runs so repeat invocations on the same
+products skip the network entirely.
+"""
+
+from typing import Any, Optional
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+
+class DiskCache:
+    """
+    Pickled values stored in a SQLite table with a per-entry expiry.
+
+    Safe to share between threads; each operation uses its own connection.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        """
+        Args:
+            path: SQLite file to store entries in
+            ttl: Default time-to-live in seconds
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+                )
+                # Drop entries that expired since the last run
+                conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND expires_at >= ?",
+                    (key, time.time())
+                ).fetchone()
+            finally:
+                conn.close()
+            return pickle.loads(row[0]) if row else None
+        except (sqlite3.Error, pickle.PickleError):
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store value under key, expiring after ttl seconds (default: self.ttl)."""
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                            (key, blob, expires_at)
+                        )
+                finally:
+                    conn.close()
+        except (sqlite3.Error, pickle.PickleError) as e:
+            print(f"Cache write failed: {e}")
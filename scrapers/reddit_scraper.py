@@ -3,11 +3,54 @@ Reddit scraper using Reddit's JSON API (more reliable than HTML scraping).
 """
 
 import requests
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import re
 
-from .base_scraper import BaseScraper
+from config.settings import CACHE_PATH, REDDIT_CACHE_TTL
+from .base_scraper import BaseScraper, query_key
+from .disk_cache import DiskCache
+
+# Worker threads for search_product (requests still go out one
+# rate-limit interval apart, see BaseScraper.rate_limit)
+SUBREDDIT_SEARCH_WORKERS = 8
+
+# Known brands/products to look for in post text (expandable)
+KNOWN_BRANDS = (
+    # Fitness
+    "rogue", "rep fitness", "titan", "bowflex", "peloton", "nordictrack",
+    "garmin", "fitbit", "whoop", "apple watch", "nike", "adidas", "under armour",
+    "lululemon", "gymshark", "reebok", "asics", "hoka", "brooks", "saucony",
+    "concept2", "assault bike", "echo bike", "schwinn", "sole", "proform",
+    "powerblock", "ironmaster", "adjustable dumbbells", "kettlebell", "barbell",
+    "squat rack", "power rack", "pull up bar", "resistance bands", "foam roller",
+    "theragun", "hypervolt", "massage gun", "yoga mat", "jump rope",
+    # Kitchen
+    "instant pot", "ninja", "cuisinart", "kitchenaid", "vitamix", "nutribullet",
+    "air fryer", "cast iron", "lodge", "le creuset", "staub", "all-clad",
+    "oxo", "pyrex", "corelle", "tupperware", "yeti", "hydroflask", "stanley",
+    "keurig", "nespresso", "breville", "chemex", "aeropress",
+    # Home
+    "roomba", "dyson", "shark", "bissell", "eufy", "ecovacs", "roborock",
+    "ring", "nest", "arlo", "wyze", "blink", "simplisafe",
+    "casper", "purple", "tuft and needle", "nectar", "saatva",
+    "ikea", "wayfair", "article", "west elm",
+    # Tech/Gadgets
+    "anker", "aukey", "belkin", "logitech", "razer", "steelseries",
+    "bose", "sony", "sennheiser", "airpods", "jabra", "soundcore",
+)
+
+# Words that follow "bought/got/recommend" but aren't products
+_SKIP_WORDS = frozenset({
+    "the", "this", "that", "these", "those", "i", "we", "you", "they",
+    "it", "my", "your", "new", "old", "good", "bad", "great", "lot",
+    "few", "some", "any", "all", "one", "two", "year", "month", "day",
+    "week", "time", "way", "thing", "stuff", "person", "people",
+    "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep",
+    "oct", "nov", "dec", "monday", "tuesday", "wednesday", "thursday",
+    "friday", "saturday", "sunday", "http", "www", "reddit", "comment"
+})
 
 
 class RedditScraper(BaseScraper):
@@ -15,9 +58,24 @@ class RedditScraper(BaseScraper):
 
     BASE_URL = "https://www.reddit.com"
 
-    def __init__(self, delay: float = 2.0):
+    def __init__(
+        self,
+        delay: float = 2.0,
+        session: Optional[requests.Session] = None,
+        cache_path: Optional[str] = CACHE_PATH
+    ):
+        """
+        Args:
+            delay: Base delay between requests
+            session: Shared HTTP session (a private one is created if omitted)
+            cache_path: SQLite file for search results kept across runs (None disables)
+        """
         super().__init__(delay)
-        self.session = requests.Session()
+        self.session = session or requests.Session()
+
+        # Search results keyed by (normalized query, limit, sort)
+        self._search_cache: Dict[tuple, Tuple[Dict[str, Any], ...]] = {}
+        self._disk_cache = DiskCache(cache_path, REDDIT_CACHE_TTL) if cache_path else None
 
     def get_headers(self) -> Dict[str, str]:
         """Reddit JSON API requires a proper User-Agent."""
@@ -180,33 +238,9 @@ class RedditScraper(BaseScraper):
 
         content_lower = content.lower()
 
-        # Known brands/products to look for (expandable)
-        known_brands = [
-            # Fitness
-            "rogue", "rep fitness", "titan", "bowflex", "peloton", "nordictrack",
-            "garmin", "fitbit", "whoop", "apple watch", "nike", "adidas", "under armour",
-            "lululemon", "gymshark", "reebok", "asics", "hoka", "brooks", "saucony",
-            "concept2", "assault bike", "echo bike", "schwinn", "sole", "proform",
-            "powerblock", "ironmaster", "adjustable dumbbells", "kettlebell", "barbell",
-            "squat rack", "power rack", "pull up bar", "resistance bands", "foam roller",
-            "theragun", "hypervolt", "massage gun", "yoga mat", "jump rope",
-            # Kitchen
-            "instant pot", "ninja", "cuisinart", "kitchenaid", "vitamix", "nutribullet",
-            "air fryer", "cast iron", "lodge", "le creuset", "staub", "all-clad",
-            "oxo", "pyrex", "corelle", "tupperware", "yeti", "hydroflask", "stanley",
-            "keurig", "nespresso", "breville", "chemex", "aeropress",
-            # Home
-            "roomba", "dyson", "shark", "bissell", "eufy", "ecovacs", "roborock",
-            "ring", "nest", "arlo", "wyze", "blink", "simplisafe",
-            "casper", "purple", "tuft and needle", "nectar", "saatva",
-            "ikea", "wayfair", "article", "west elm",
-            # Tech/Gadgets
-            "anker", "aukey", "belkin", "logitech", "razer", "steelseries",
-            "bose", "sony", "sennheiser", "airpods", "jabra", "soundcore",
-        ]
 
         # Check for known brands
-        for brand in known_brands:
+        for brand in KNOWN_BRANDS:
             if brand in content_lower:
                 # Try to get more context (brand + model)
                 pattern = rf"({re.escape(brand)}[\w\s\-]*?)(?:\.|,|\s+is|\s+are|\s+was|\s+for|\s+and|$)"
@@ -229,16 +263,7 @@ class RedditScraper(BaseScraper):
             for match in matches:
                 cleaned = match.strip()
                 # Filter out obvious non-products
-                skip_words = [
-                    "the", "this", "that", "these", "those", "i", "we", "you", "they",
-                    "it", "my", "your", "new", "old", "good", "bad", "great", "lot",
-                    "few", "some", "any", "all", "one", "two", "year", "month", "day",
-                    "week", "time", "way", "thing", "stuff", "person", "people",
-                    "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep",
-                    "oct", "nov", "dec", "monday", "tuesday", "wednesday", "thursday",
-                    "friday", "saturday", "sunday", "http", "www", "reddit", "comment"
-                ]
-                if cleaned.lower() not in skip_words and 3 < len(cleaned) < 40:
+                if cleaned.lower() not in _SKIP_WORDS and 3 < len(cleaned) < 40:
                     # Check it looks like a product (has some structure)
                     if re.match(r'^[A-Z]', cleaned):
                         products.append(cleaned)
@@ -325,18 +350,27 @@ class RedditScraper(BaseScraper):
                 "gadgets",
             ]
 
-        all_results = []
+        if not subreddits:
+            return []
 
-        for subreddit in subreddits:
-            results = self.search_subreddit(subreddit, product_name, limit=limit_per_sub)
-            all_results.extend(results)
-
-        return all_results
+        # Subreddit searches are independent; workers take turns through the
+        # shared per-host rate limit, so only response handling overlaps.
+        # map() keeps results in subreddit order.
+        with ThreadPoolExecutor(max_workers=min(len(subreddits), SUBREDDIT_SEARCH_WORKERS)) as executor:
+            per_subreddit = executor.map(
+                lambda subreddit: self.search_subreddit(subreddit, product_name, limit=limit_per_sub),
+                subreddits
+            )
+            return [post for results in per_subreddit for post in results]
 
     def search_all_reddit(self, query: str, limit: int = 50, sort: str = "relevance") -> List[Dict[str, Any]]:
         """
         Search across all of Reddit for a product.
 
+        Results are cached per scraper instance, so repeated queries
+        (ignoring case and spacing) only hit the network once, and on disk
+        for REDDIT_CACHE_TTL so repeat runs can skip the search too.
+
         Args:
             query: Search query
             limit: Number of results
@@ -345,6 +379,29 @@ class RedditScraper(BaseScraper):
         Returns:
             List of matching posts from any subreddit
         """
+        # Cached as tuples and handed out as fresh lists, so callers that
+        # extend or filter their result can't change the cached entry
+        key = (query_key(query), limit, sort)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        disk_key = f"reddit:{key[0]}:{limit}:{sort}"
+        if self._disk_cache:
+            cached = self._disk_cache.get(disk_key)
+            if cached is not None:
+                self._search_cache[key] = tuple(cached)
+                return list(cached)
+
+        posts = self._search_all_reddit(query, limit, sort)
+        if posts is not None:
+            self._search_cache[key] = tuple(posts)
+            if self._disk_cache:
+                self._disk_cache.set(disk_key, posts)
+        return posts or []
+
+    def _search_all_reddit(self, query: str, limit: int, sort: str) -> Optional[List[Dict[str, Any]]]:
+        """Fetch search results from Reddit (None on request failure)."""
         posts = []
         url = f"{self.BASE_URL}/search.json"
         params = {
@@ -372,7 +429,9 @@ class RedditScraper(BaseScraper):
 
         except requests.RequestException as e:
             print(f"Error searching Reddit: {e}")
+            return None
         except ValueError as e:
             print(f"Error parsing search JSON: {e}")
+            return None
 
         return posts
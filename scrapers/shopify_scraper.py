@@ -5,7 +5,7 @@ Checks how many Shopify stores are selling a product
 
 import requests
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 
@@ -13,9 +13,10 @@ from fake_useragent import UserAgent
 class ShopifyScraper:
     """Check Shopify marketplace competition for products."""
 
-    def __init__(self, delay: float = 2.0):
+    def __init__(self, delay: float = 2.0, session: Optional[requests.Session] = None):
         self.delay = delay
         self.ua = UserAgent()
+        self.session = session or requests.Session()
 
     def check_competition(self, product_name: str) -> Dict[str, Any]:
         """
@@ -46,7 +47,7 @@ class ShopifyScraper:
                 "num": 50,  # Get more results
             }
 
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
 
             # Parse results
@@ -7,6 +7,10 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import time
 
+from config.settings import CACHE_PATH, TRENDS_CACHE_TTL
+from .base_scraper import cache_key
+from .disk_cache import DiskCache
+
 
 class TrendsScraper:
     """
@@ -14,11 +18,20 @@ class TrendsScraper:
     Validates if a product has rising search interest.
     """
 
-    def __init__(self, delay: float = 2.0):
+    def __init__(self, delay: float = 2.0, cache_path: Optional[str] = CACHE_PATH):
+        """
+        Args:
+            delay: Seconds to wait before each Trends request
+            cache_path: SQLite file for results kept across runs (None disables)
+        """
         self.delay = delay
         self.pytrends = None
         self._init_pytrends()
 
+        # Trend results keyed by (normalized keyword, timeframe)
+        self._trend_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._disk_cache = DiskCache(cache_path, TRENDS_CACHE_TTL) if cache_path else None
+
     def _init_pytrends(self):
         """Initialize pytrends connection."""
         try:
@@ -39,6 +52,29 @@ class TrendsScraper:
         Returns:
             Dictionary with trend data
         """
+        # Callers get their own copy so they can't change the cached entry
+        key = (cache_key(keyword), timeframe)
+        cached = self._trend_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        disk_key = f"trends:{key[0]}:{timeframe}"
+        if self._disk_cache:
+            cached = self._disk_cache.get(disk_key)
+            if cached is not None:
+                self._trend_cache[key] = cached
+                return dict(cached)
+
+        result = self._fetch_trend(keyword, timeframe)
+        if "error" not in result:
+            self._trend_cache[key] = result
+            if self._disk_cache:
+                self._disk_cache.set(disk_key, result)
+            return dict(result)
+        return result
+
+    def _fetch_trend(self, keyword: str, timeframe: str) -> Dict[str, Any]:
+        """Query Google Trends for a keyword (uncached)."""
         if not self.pytrends:
             return {"error": "pytrends not available", "keyword": keyword}
 